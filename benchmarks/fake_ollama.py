@@ -0,0 +1,165 @@
+# benchmarks/fake_ollama.py
+"""
+Local stand-in for the Ollama HTTP API, for reproducible benchmarks.
+
+Implements /api/chat (streaming and non-streaming), /api/tags, /api/ps,
+/api/version and empty-prompt /api/generate (model warm-up). Responses
+echo the last user message and include the timing/count fields real
+Ollama returns (prompt_eval_count, eval_count, eval_duration,
+load_duration, ...).
+
+Usage:
+    server = FakeOllamaServer(latency=0.05, tokens_per_second=200)
+    server.start()
+    os.environ['OLLAMA_HOST'] = server.host   # before importing ollama
+"""
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog (5) makes a burst of new connections hit
+    # TCP retries, so batch benchmarks would measure the harness
+    request_queue_size = 128
+
+
+class FakeOllamaServer:
+    """Threaded fake Ollama server with configurable latency and token rate"""
+
+    def __init__(self, port: int = 0, latency: float = 0.05,
+                 tokens_per_second: float = 200.0, response_tokens: int = 20,
+                 prefill_tokens_per_second: float = 0.0,
+                 models=('llama3.2:3b', 'gpt-oss:20b')):
+        """
+        Args:
+            port: Port to bind on 127.0.0.1 (0 = pick a free one)
+            latency: Seconds before the first token (model load + prefill)
+            tokens_per_second: Generation rate for the response
+            response_tokens: Tokens generated per response
+            prefill_tokens_per_second: If > 0, adds prompt_tokens / rate to
+                the latency so longer prompts are slower, like a CPU box
+            models: Model names reported as available/resident
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.prefill_tokens_per_second = prefill_tokens_per_second
+        self.models = list(models)
+        self.requests = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == '/api/tags':
+                    self._send_json({'models': [{'name': m, 'model': m} for m in server.models]})
+                elif self.path == '/api/ps':
+                    self._send_json({'models': [{'name': m, 'model': m} for m in server.models]})
+                elif self.path == '/api/version':
+                    self._send_json({'version': 'fake'})
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                if self.path == '/api/generate':
+                    # Empty-prompt generate = load the model (OllamaPool.warm_up)
+                    self._send_json({'model': request.get('model', ''), 'created_at': '',
+                                     'response': '', 'done': True})
+                    return
+                if self.path != '/api/chat':
+                    self._send_json({})
+                    return
+                server.requests += 1
+                server._chat(self, request)
+
+        self._httpd = _FakeHTTPServer(('127.0.0.1', port), Handler)
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def start(self) -> 'FakeOllamaServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _chat(self, handler, request):
+        messages = request.get('messages', [])
+        prompt_chars = sum(len(m.get('content', '')) for m in messages)
+        prompt_tokens = max(1, prompt_chars // 4)
+        last = messages[-1]['content'] if messages else ''
+
+        delay = self.latency
+        if self.prefill_tokens_per_second > 0:
+            delay += prompt_tokens / self.prefill_tokens_per_second
+        time.sleep(delay)
+
+        words = (f"Echo: {last}".split() + ['lorem'] * self.response_tokens)[:self.response_tokens]
+        per_token = 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        base = {
+            'model': request.get('model', ''),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        }
+        stats = {
+            'done': True,
+            'done_reason': 'stop',
+            'total_duration': int((delay + per_token * len(words)) * 1e9),
+            'load_duration': int(self.latency * 0.1 * 1e9),
+            'prompt_eval_count': prompt_tokens,
+            'prompt_eval_duration': int(delay * 1e9),
+            'eval_count': len(words),
+            'eval_duration': int(per_token * len(words) * 1e9),
+        }
+
+        if not request.get('stream', True):
+            time.sleep(per_token * len(words))
+            handler._send_json({**base, 'message': {'role': 'assistant', 'content': ' '.join(words)}, **stats})
+            return
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/x-ndjson')
+        handler.end_headers()
+        for i, word in enumerate(words):
+            chunk = {**base, 'message': {'role': 'assistant', 'content': word if i == 0 else ' ' + word},
+                     'done': False}
+            handler.wfile.write((json.dumps(chunk) + '\n').encode())
+            handler.wfile.flush()
+            time.sleep(per_token)
+        final = {**base, 'message': {'role': 'assistant', 'content': ''}, **stats}
+        handler.wfile.write((json.dumps(final) + '\n').encode())
+        handler.wfile.flush()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run a fake Ollama server')
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--tokens-per-second', type=float, default=200.0)
+    args = parser.parse_args()
+
+    fake = FakeOllamaServer(args.port, args.latency, args.tokens_per_second)
+    print(f"Fake Ollama listening on {fake.host}")
+    fake._httpd.serve_forever()
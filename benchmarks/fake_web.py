@@ -0,0 +1,129 @@
+# benchmarks/fake_web.py
+"""
+Local web server with synthetic article pages, for benchmarking the
+page-fetch stage (orchestrator/PageFetcher.py) offline.
+
+Every path is an HTML article with navigation/footer boilerplate around
+it. Responses carry an ETag and Last-Modified header and honour
+If-None-Match / If-Modified-Since with 304 Not Modified. /big/... pages
+are much larger than a typical article (for the size cap); /slow/...
+pages trickle out in 10 chunks, `latency` apart (for the page deadline).
+
+Usage:
+    server = FakeWebServer(latency=0.05).start()
+    url = f"{server.url}/quantum-computing/0"
+"""
+import hashlib
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+WORDS = ("market stock analysis quantum computing research summary energy climate "
+         "biology history music python model search index design plan review").split()
+
+
+def make_page(path: str, paragraphs: int = 30, words: int = 60) -> str:
+    """Deterministic article HTML for a path"""
+    rng = random.Random(path)
+    topic = path.strip('/').split('/')[0].replace('-', ' ')
+    nav = ''.join(f'<li><a href="/{w}">{w}</a></li>' for w in WORDS)
+    body = ''.join(
+        f"<p>{topic} {' '.join(rng.choice(WORDS) for _ in range(words))}.</p>\n"
+        for _ in range(paragraphs)
+    )
+    return (
+        f"<!doctype html><html><head><title>{topic.title()}</title>"
+        f"<style>p {{ margin: 0 }}</style><script>var tracking = 1;</script></head>"
+        f"<body><header><nav><ul>{nav}</ul></nav></header>"
+        f"<main><article><h1>{topic.title()}</h1>\n{body}</article></main>"
+        f"<aside>Related links and adverts that are not part of the article text at all.</aside>"
+        f"<footer>Copyright footer text repeated on every page of this site.</footer></body></html>"
+    )
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # well above the fetch concurrency (default backlog is 5)
+
+    def handle_error(self, request, client_address):
+        pass  # clients drop keep-alive connections mid-read when they hit the size cap
+
+
+class FakeWebServer:
+    """Threaded HTTP server returning synthetic articles with validators"""
+
+    def __init__(self, port: int = 0, latency: float = 0.05, paragraphs: int = 30):
+        """
+        Args:
+            port: Port to bind on 127.0.0.1 (0 = pick a free one)
+            latency: Seconds before each response (simulated network + server)
+            paragraphs: Paragraphs per normal page (/big/ pages have 50x more)
+        """
+        self.latency = latency
+        self.paragraphs = paragraphs
+        self.last_modified = formatdate(time.time() - 3600, usegmt=True)
+        self.requests = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, so connection reuse is measurable
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                time.sleep(server.latency)
+
+                big = self.path.startswith('/big/')
+                page = make_page(self.path, server.paragraphs * (50 if big else 1)).encode()
+                etag = '"' + hashlib.sha1(page).hexdigest()[:16] + '"'
+
+                if self.headers.get('If-None-Match') == etag:
+                    with server._lock:
+                        server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(page)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', server.last_modified)
+                self.end_headers()
+                try:
+                    if self.path.startswith('/slow/'):
+                        step = len(page) // 10 + 1
+                        for start in range(0, len(page), step):
+                            self.wfile.write(page[start:start + step])
+                            self.wfile.flush()
+                            time.sleep(server.latency)
+                    else:
+                        self.wfile.write(page)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client stopped reading (size cap)
+
+        self._httpd = _QuietHTTPServer(('127.0.0.1', port), Handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def start(self) -> 'FakeWebServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
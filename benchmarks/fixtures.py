@@ -0,0 +1,152 @@
+# benchmarks/fixtures.py
+"""Synthetic inputs for benchmarks: skills, Obsidian vaults and a canned search backend."""
+import random
+import time
+from pathlib import Path
+from typing import List, Dict
+
+WORDS = ("market stock analysis quantum computing research summary note daily "
+         "python agent model search index vault tag link project idea meeting "
+         "review design plan draft energy climate biology history music").split()
+
+
+def make_skills_dir(root: str, count: int = 40, triggers_per_skill: int = 5,
+                    sections: int = 6, seed: int = 0) -> str:
+    """
+    Create `count` skills under root/skill-N/SKILL.md with frontmatter
+    triggers and several markdown sections. Every 10th skill requires a tool.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    for i in range(count):
+        skill_dir = root / f"skill-{i}"
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        triggers = [f"trig{i}x{j}" for j in range(triggers_per_skill)]
+        lines = ["---", f"name: skill-{i}", f"description: Synthetic skill {i}", "triggers:"]
+        lines += [f"  - {t}" for t in triggers]
+        if i % 10 == 0:
+            lines.append("requires_tool: bench_tool")
+        lines += ["---", "", f"# Skill {i}", "Overview of the skill.", ""]
+        for s in range(sections):
+            lines.append(f"## Section {s}")
+            lines.append(' '.join(rng.choice(WORDS) for _ in range(120)))
+            lines.append("")
+        (skill_dir / "SKILL.md").write_text('\n'.join(lines))
+    return str(root)
+
+
+def make_agents_config(path: str, skills: int = 40, agents: int = 8) -> str:
+    """agents.yaml with `agents` agents sharing the synthetic skills round-robin"""
+    lines = ["agents:"]
+    for a in range(agents):
+        lines += [
+            f"  agent_{a}:",
+            '    model: "llama3.2:3b"',
+            "    max_context_tokens: 3000",
+            "    skills:",
+        ]
+        lines += [f"      - skill-{i}" for i in range(a, skills, agents) if i % 10 != 0]
+        lines += ["    triggers:"]
+        lines += [f"      - agenttrig{a}x{j}" for j in range(5)]
+        lines += ["    system_prompt: |", f"      You are synthetic agent {a}."]
+    lines += [
+        "  research_agent:",
+        '    model: "llama3.2:3b"',
+        "    max_context_tokens: 3000",
+        "    skills: []",
+        "    triggers: [research*]",
+        "    system_prompt: |",
+        "      You are a research agent.",
+        "  doc_agent:",
+        '    model: "llama3.2:3b"',
+        "    skills: []",
+        "    triggers: [format*]",
+        "    system_prompt: |",
+        "      You are a document agent.",
+        "  general_agent:",
+        '    model: "llama3.2:3b"',
+        "    skills: []",
+        "    triggers: []",
+        "    system_prompt: |",
+        "      You are a helpful assistant.",
+    ]
+    Path(path).write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def make_queries(count: int, skills: int = 40, agents: int = 8, seed: int = 0) -> List[str]:
+    """Mix of agent-trigger, skill-trigger and unmatched queries"""
+    rng = random.Random(seed)
+    queries = []
+    for n in range(count):
+        filler = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 30)))
+        kind = n % 3
+        if kind == 0:
+            queries.append(f"{filler} agenttrig{rng.randrange(agents)}x{rng.randrange(5)} {filler}")
+        elif kind == 1:
+            queries.append(f"{filler} trig{rng.randrange(skills)}x{rng.randrange(5)}")
+        else:
+            queries.append(filler)
+    return queries
+
+
+def make_vault(root: str, notes: int = 1000, tags: int = 10, folders: int = 20,
+               seed: int = 0) -> str:
+    """
+    Obsidian-like vault: `notes` markdown files spread over `folders`
+    folders, with wikilinks and ordinary tags. `tags` notes (spread
+    evenly) get an #open-research line; a few topics repeat across notes.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    tag_every = max(1, notes // tags) if tags else 0
+    tagged = 0
+    for n in range(notes):
+        folder = root / f"folder-{n % folders}"
+        folder.mkdir(parents=True, exist_ok=True)
+        body = [f"# Note {n}", ""]
+        body += [' '.join(rng.choice(WORDS) for _ in range(60)) for _ in range(5)]
+        body.append(f"Related: [[Note {rng.randrange(notes)}]] #{rng.choice(WORDS)}")
+        if tag_every and n % tag_every == 0 and tagged < tags:
+            topic = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {tagged % max(1, tags - 2)}"
+            body.append(f"#open-research {topic}")
+            tagged += 1
+        (folder / f"Note {n}.md").write_text('\n'.join(body) + '\n')
+    return str(root)
+
+
+def touch_notes(root: str, count: int, seed: int = 1):
+    """Append a line to `count` random notes (simulates a day of edits)"""
+    rng = random.Random(seed)
+    paths = sorted(Path(root).rglob('*.md'))
+    for path in rng.sample(paths, min(count, len(paths))):
+        with open(path, 'a') as f:
+            f.write(f"edited {time.time()}\n")
+
+
+class CannedSearch:
+    """
+    Offline stand-in for DuckDuckGoSearchTool: deterministic results
+    after a fixed simulated network latency.
+    """
+
+    def __init__(self, latency: float = 0.05, snippet_words: int = 40):
+        self.latency = latency
+        self.snippet_words = snippet_words
+        self.calls = 0
+
+    def search_duckduckgo(self, query: str, max_results: int = 5) -> List[Dict]:
+        self.calls += 1
+        time.sleep(self.latency)
+        rng = random.Random(query)
+        return [{
+            'title': f"{query.title()} - result {i + 1}",
+            'url': f"https://example.com/{query.replace(' ', '-')}/{i}",
+            'snippet': ' '.join(rng.choice(WORDS) for _ in range(self.snippet_words)),
+        } for i in range(max_results)]
+
+    def format_results_for_llm(self, query: str, results: List[Dict]) -> str:
+        out = [f"# Search Results for: {query}\n"]
+        for i, r in enumerate(results, 1):
+            out.append(f"## Result {i}: {r['title']}\nURL: {r['url']}\nSummary: {r['snippet']}\n")
+        return '\n'.join(out)
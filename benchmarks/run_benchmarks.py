@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the orchestrator.
+
+Runs entirely locally: a fake Ollama server (benchmarks/fake_ollama.py),
+a canned search backend and synthetic skills/vaults (benchmarks/fixtures.py).
+Results are written as JSON so runs can be compared across commits.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # full suite
+    python benchmarks/run_benchmarks.py --quick              # smaller sizes
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --compare before.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path (same approach as main.py)
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks import fixtures
+from benchmarks.fake_ollama import FakeOllamaServer
+from benchmarks.fake_web import FakeWebServer
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    """Nearest-rank percentiles in milliseconds"""
+    ordered = sorted(samples)
+    out = {}
+    for p in points:
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        out[f"p{p}_ms"] = round(ordered[index] * 1000, 3)
+    out['mean_ms'] = round(sum(ordered) / len(ordered) * 1000, 3)
+    return out
+
+
+@contextlib.contextmanager
+def quiet():
+    """The orchestrator prints on every routing decision; keep that out of timings"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class NoopTool:
+    def execute(self, **kwargs) -> str:
+        return 'ok'
+
+
+def bench_select_agent(AgentOrchestrator, config, skills_dir, queries):
+    orchestrator = AgentOrchestrator(config, skills_dir)
+    with quiet():
+        orchestrator.select_agent(queries[0])  # build index / warm caches
+        start = time.perf_counter()
+        for query in queries:
+            orchestrator.select_agent(query)
+        elapsed = time.perf_counter() - start
+    return {
+        'queries': len(queries),
+        'queries_per_sec': round(len(queries) / elapsed, 1),
+        'us_per_query': round(elapsed / len(queries) * 1e6, 2),
+    }
+
+
+def bench_load_skill(AgentOrchestrator, config, skills_dir, skill_count, rounds=20):
+    names = [f"skill-{i}" for i in range(skill_count)]
+
+    orchestrator = AgentOrchestrator(config, skills_dir)
+    start = time.perf_counter()
+    for name in names:
+        orchestrator.load_skill(name)
+    cold = (time.perf_counter() - start) / len(names)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for name in names:
+            orchestrator.load_skill(name)
+    warm = (time.perf_counter() - start) / (len(names) * rounds)
+
+    return {
+        'skills': skill_count,
+        'cold_us': round(cold * 1e6, 2),
+        'warm_us': round(warm * 1e6, 2),
+        'registry': orchestrator.skill_registry.stats(),
+    }
+
+
+def bench_prompt_build(AgentOrchestrator, config, skills_dir, queries, agents=8):
+    orchestrator = AgentOrchestrator(config, skills_dir)
+    with quiet():
+        samples = []
+        for n, query in enumerate(queries):
+            start = time.perf_counter()
+            messages = orchestrator.build_messages(f"agent_{n % agents}", query)
+            samples.append(time.perf_counter() - start)
+    return {
+        **percentiles(samples),
+        'system_prompt_chars': len(messages[0]['content']),
+        'context_stats': orchestrator.context_stats,
+    }
+
+
+def bench_orchestrate(AgentOrchestrator, config, skills_dir, queries, concurrency=8):
+    orchestrator = AgentOrchestrator(config, skills_dir)
+    sequential = []
+    with quiet():
+        # Workflow skills (requires_tool: bench_tool) resolve to a no-op tool
+        orchestrator.register_tool('bench_tool', NoopTool())
+        for query in queries:
+            start = time.perf_counter()
+            orchestrator.orchestrate(query)
+            sequential.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        asyncio.run(orchestrator.orchestrate_many(queries, concurrency=concurrency))
+        batch = time.perf_counter() - start
+
+    return {
+        'queries': len(queries),
+        'sequential': percentiles(sequential),
+        'sequential_total_s': round(sum(sequential), 3),
+        'batch_concurrency': concurrency,
+        'batch_total_s': round(batch, 3),
+    }
+
+
+def bench_daily_summary(AgentOrchestrator, config, skills_dir, workdir, notes, tags, search_latency):
+    """
+    The daily-summary path built from this repo's pieces: index the vault,
+    find changed notes and #open-research tags, research each topic, then
+    one doc_agent call to format the result.
+    """
+    from orchestrator.VaultIndex import VaultIndex
+    from orchestrator.ResearchPipeline import ResearchPipeline
+
+    vault = fixtures.make_vault(os.path.join(workdir, f"vault-{notes}-{tags}"), notes, tags)
+    index = VaultIndex(vault, os.path.join(workdir, f"index-{notes}-{tags}.sqlite"))
+    orchestrator = AgentOrchestrator(config, skills_dir)
+    search = fixtures.CannedSearch(latency=search_latency)
+
+    def run_summary():
+        start = time.perf_counter()
+        since = time.time() - 24 * 3600
+        scan = index.refresh()
+        changed = index.changed_since(since)
+        topics = [(hit['line'].split('#open-research', 1)[1].strip(), hit['path'])
+                  for hit in index.tagged('open-research')]
+        research = ResearchPipeline(orchestrator, search, skills=[]).run(topics)
+        body = '\n'.join(f"## {r['topic']}\n{r['summary']}" for r in research)
+        orchestrator.invoke_agent('doc_agent', f"Format this daily summary ({len(changed)} notes changed)",
+                                  skills=[], context=body)
+        return time.perf_counter() - start, scan, len(research)
+
+    with quiet():
+        cold, cold_scan, topics = run_summary()
+        fixtures.touch_notes(vault, max(1, notes // 50))
+        warm, warm_scan, _ = run_summary()
+
+    return {
+        'notes': notes,
+        'tags': tags,
+        'unique_topics': topics,
+        'cold_s': round(cold, 3),
+        'warm_s': round(warm, 3),
+        'cold_scan': cold_scan,
+        'warm_scan': warm_scan,
+    }
+
+
+def bench_page_fetch(workdir, pages, page_latency):
+    """
+    The web-research fetch stage against a local site: serial vs concurrent
+    cold fetches, warm (cache hits), revalidation (304s) and the size cap.
+    """
+    from orchestrator.PageFetcher import PageFetcher
+
+    site = FakeWebServer(latency=page_latency).start()
+    # Several hosts' worth of URLs (127.0.0.1 and localhost count separately for per_host)
+    hosts = [site.url, site.url.replace('127.0.0.1', 'localhost')]
+    urls = [f"{hosts[n % 2]}/topic-{n % 5}/{n}" for n in range(pages)]
+
+    def timed(fetcher):
+        start = time.perf_counter()
+        fetcher.fetch_many(urls)
+        return round(time.perf_counter() - start, 3)
+
+    serial = PageFetcher(os.path.join(workdir, 'pages-serial.sqlite'), concurrency=1, per_host=1)
+    serial_s = timed(serial)
+    serial.close()
+
+    fetcher = PageFetcher(os.path.join(workdir, 'pages.sqlite'))
+    cold_s = timed(fetcher)
+    warm_s = timed(fetcher)
+    fetcher.ttl = 0  # everything stale -> conditional requests
+    revalidate_s = timed(fetcher)
+
+    before = fetcher.stats()['bytes_read']
+    big = fetcher.fetch(f"{site.url}/big/page")
+    stats = fetcher.stats()
+    fetcher.close()
+    site.stop()
+
+    return {
+        'pages': pages,
+        'serial_cold_s': serial_s,
+        'concurrent_cold_s': cold_s,
+        'warm_s': warm_s,
+        'revalidate_s': revalidate_s,
+        'big_page_bytes_read': stats['bytes_read'] - before,
+        'big_page_paragraphs': len(big.get('paragraphs', [])),
+        'fetcher': stats,
+    }
+
+
+def compare(current, baseline_path):
+    """Print per-metric ratios against a previous results file"""
+    baseline = json.loads(Path(baseline_path).read_text())
+    print(f"\nComparison vs {baseline.get('commit')} ({baseline_path}):")
+
+    def walk(cur, base, prefix=''):
+        for key, value in cur.items():
+            if key not in base:
+                continue
+            name = f"{prefix}{key}"
+            if isinstance(value, dict) and isinstance(base[key], dict):
+                walk(value, base[key], name + '.')
+            elif isinstance(value, (int, float)) and isinstance(base[key], (int, float)) and base[key]:
+                if key.endswith(('_ms', '_us', '_s', 'per_sec')):
+                    ratio = value / base[key]
+                    print(f"  {name:<60} {base[key]:>12} -> {value:>12}  ({ratio:.2f}x)")
+
+    walk(current['results'], baseline.get('results', {}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline orchestrator benchmarks')
+    parser.add_argument('--quick', action='store_true', help='Smaller sizes for a fast smoke run')
+    parser.add_argument('--output', default='bench_results.json', help='Where to write JSON results')
+    parser.add_argument('--compare', help='Previous results JSON to compare against')
+    parser.add_argument('--latency', type=float, default=0.02, help='Fake Ollama time to first token (s)')
+    parser.add_argument('--tokens-per-second', type=float, default=500.0, help='Fake Ollama generation rate')
+    parser.add_argument('--search-latency', type=float, default=0.02, help='Canned search latency (s)')
+    parser.add_argument('--page-latency', type=float, default=0.05, help='Local web server latency (s)')
+    args = parser.parse_args()
+
+    skill_count = 20 if args.quick else 40
+    query_count = 500 if args.quick else 5000
+    e2e_queries = 20 if args.quick else 100
+    vault_sizes = [(200, 5)] if args.quick else [(500, 5), (2000, 20), (5000, 20)]
+    fetch_pages = 10 if args.quick else 40
+
+    server = FakeOllamaServer(latency=args.latency, tokens_per_second=args.tokens_per_second).start()
+    os.environ['OLLAMA_HOST'] = server.host
+
+    # Import after OLLAMA_HOST is set - ollama's default client reads it at import time
+    from orchestrator.AgentOrchestrator import AgentOrchestrator
+
+    with tempfile.TemporaryDirectory() as workdir:
+        skills_dir = fixtures.make_skills_dir(os.path.join(workdir, 'skills'), skill_count)
+        config = fixtures.make_agents_config(os.path.join(workdir, 'agents.yaml'), skill_count)
+        queries = fixtures.make_queries(query_count, skill_count)
+
+        results = {}
+        print("Benchmarking select_agent...")
+        results['select_agent'] = bench_select_agent(AgentOrchestrator, config, skills_dir, queries)
+        print("Benchmarking load_skill...")
+        results['load_skill'] = bench_load_skill(AgentOrchestrator, config, skills_dir, skill_count)
+        print("Benchmarking prompt build...")
+        results['prompt_build'] = bench_prompt_build(AgentOrchestrator, config, skills_dir, queries[:500])
+        print("Benchmarking orchestrate end-to-end...")
+        results['orchestrate'] = bench_orchestrate(AgentOrchestrator, config, skills_dir,
+                                                   queries[:e2e_queries])
+        results['daily_summary'] = {}
+        for notes, tags in vault_sizes:
+            print(f"Benchmarking daily summary ({notes} notes, {tags} tags)...")
+            results['daily_summary'][f"{notes}_notes_{tags}_tags"] = bench_daily_summary(
+                AgentOrchestrator, config, skills_dir, workdir, notes, tags, args.search_latency)
+        print("Benchmarking page fetch...")
+        results['page_fetch'] = bench_page_fetch(workdir, fetch_pages, args.page_latency)
+
+    server.stop()
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': vars(args),
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(json.dumps(results, indent=2))
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import sys
 from pathlib import Path
 
@@ -7,33 +8,48 @@ sys.path.insert(0, str(project_root / '.claude' / 'skills' / 'obsidian-integrati
 sys.path.insert(0, str(project_root / '.claude' / 'skills' / 'web-search' / 'scripts'))
 
 # main.py - Simple setup for non-developers
-from orchestrator.AgentOrchestrator import AgentOrchestrator
-from ObsidianTool import ObsidianTool
-from WebSearchTool import WebSearchTool
-from DuckDuckGoSearchTool import DuckDuckGoSearchTool
+# The orchestrator and tools are imported inside the functions below, so
+# `--ask` (which only talks to a running server) starts instantly.
 
 def setup_orchestrator(vault_path: str):
     """One function to set everything up"""
-    
+    from orchestrator.AgentOrchestrator import AgentOrchestrator
+    from orchestrator.SearchCache import SearchCache
+
     # Create main orchestrator with correct skills path
     orchestrator = AgentOrchestrator(
         config_path="agents/agents.yaml",
         skills_dir=".claude/skills"
     )
 
-    # Register tools
-    obsidian_tool = ObsidianTool(vault_path, orchestrator)
-    orchestrator.register_tool('obsidian_tool', obsidian_tool)
+    # Register tools - each is only built the first time a workflow needs it
+    def make_obsidian_tool():
+        from ObsidianTool import ObsidianTool
+        return ObsidianTool(vault_path, orchestrator)
+
+    orchestrator.register_tool_factory('obsidian_tool', make_obsidian_tool)
 
     # Use DuckDuckGo for actual web search (requires: pip install duckduckgo-search)
-    # Comment out this line and uncomment the next one to use placeholder WebSearchTool
-    ddg_search_tool = DuckDuckGoSearchTool(orchestrator)
-    orchestrator.register_tool('web_search_tool', ddg_search_tool)
+    # Swap make_search_tool for the commented-out version to use placeholder WebSearchTool
+    def make_search_tool():
+        from DuckDuckGoSearchTool import DuckDuckGoSearchTool
+        ddg_search_tool = DuckDuckGoSearchTool(orchestrator)
+        # Cache search results on disk (24h TTL) so re-runs don't hit DuckDuckGo again
+        search_cache = SearchCache(".cache/search_cache.sqlite")
+        search = search_cache.wrap(ddg_search_tool.search_duckduckgo)
+        # Optional: also fetch the result pages and pass their best passages to the LLM
+        # from orchestrator.PageFetcher import PageFetcher
+        # search = PageFetcher(".cache/page_cache.sqlite").wrap(search)
+        ddg_search_tool.search_duckduckgo = orchestrator.instrumentation.wrap('search_duckduckgo', search)
+        return ddg_search_tool
 
     # Alternative: Placeholder web search tool (no actual search)
-    # web_search_tool = WebSearchTool(orchestrator)
-    # orchestrator.register_tool('web_search_tool', web_search_tool)
-    
+    # def make_search_tool():
+    #     from WebSearchTool import WebSearchTool
+    #     return WebSearchTool(orchestrator)
+
+    orchestrator.register_tool_factory('web_search_tool', make_search_tool)
+
     return orchestrator
 
 
@@ -41,10 +57,38 @@ def setup_orchestrator(vault_path: str):
 if __name__ == "__main__":
     # Configure your vault path here
     MY_VAULT_PATH = "/Users/paulgrossi/Library/Mobile Documents/iCloud~md~obsidian/Documents/Vault"
-    
-    # Setup
-    orchestrator = setup_orchestrator(MY_VAULT_PATH)
-    
-    # Use it
-    result = orchestrator.orchestrate("Generate my obsidian daily summary")
-    print(result)
\ No newline at end of file
+
+    parser = argparse.ArgumentParser(description='Agent orchestrator')
+    parser.add_argument('--serve', action='store_true', help='Run as a long-lived server')
+    parser.add_argument('--ask', metavar='QUERY', help='Send a query to a running server')
+    parser.add_argument('--port', type=int, default=8765, help='Server port (default: 8765)')
+    parser.add_argument('--socket', help='Use this Unix socket instead of a TCP port')
+    parser.add_argument('--priority', default='interactive',
+                        help='Job priority for --ask: interactive, normal or background')
+    parser.add_argument('--daily-summary-every', type=float, metavar='HOURS',
+                        help='With --serve: queue the daily summary every N hours')
+    args = parser.parse_args()
+
+    if args.ask:
+        from orchestrator.OrchestratorServer import OrchestratorClient
+        client = OrchestratorClient(port=args.port, socket_path=args.socket)
+        try:
+            print(client.ask(args.ask, priority=args.priority))
+        except OSError as e:
+            sys.exit(f"Could not reach the orchestrator server ({e}). Start it with: python main.py --serve")
+
+    elif args.serve:
+        from orchestrator.OrchestratorServer import OrchestratorServer
+        server = OrchestratorServer(setup_orchestrator(MY_VAULT_PATH),
+                                    port=args.port, socket_path=args.socket)
+        if args.daily_summary_every:
+            server.schedule("Generate my obsidian daily summary", args.daily_summary_every * 3600)
+        server.serve_forever()
+
+    else:
+        # Setup
+        orchestrator = setup_orchestrator(MY_VAULT_PATH)
+
+        # Use it
+        result = orchestrator.orchestrate("Generate my obsidian daily summary")
+        print(result)
@@ -1,9 +1,32 @@
 # agents/orchestrator/AgentOrchestrator.py
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union, Iterator
+import asyncio
+import contextlib
+import contextvars
+import time
+import threading
+import weakref
 import yaml
-import ollama
 from pathlib import Path
 
+from orchestrator.SkillRegistry import SkillRegistry, parse_skill_metadata
+from orchestrator.TriggerIndex import TriggerIndex
+from orchestrator.AgentStream import AgentStream
+from orchestrator.ContextBudget import compact_skills, estimate_tokens
+from orchestrator.Instrumentation import Instrumentation
+from orchestrator.ResponseCache import ResponseCache, response_key
+from orchestrator.OllamaPool import OllamaPool
+
+# Per-batch {model: Semaphore} set by orchestrate_many; seen only by that batch's tasks
+_batch_semaphores = contextvars.ContextVar('batch_semaphores', default=None)
+
+
+def _check_limit(name: str, limit) -> None:
+    """Concurrency limits must be ints >= 1 (a semaphore of 0 never lets anything through)"""
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"{name} must be an integer >= 1, got {limit!r}")
+
+
 class AgentOrchestrator:
     """
     Multi-agent orchestration framework.
@@ -22,14 +45,112 @@ class AgentOrchestrator:
             config_path: Path to agents.yaml
             skills_dir: Path to skills directory
         """
-        self.agents = self._load_agent_config(config_path)
+        self.config_path = Path(config_path)
+        config = self._read_config(config_path)
+        self.agents = config['agents']
         self.skills_dir = Path(skills_dir)
+        self.skill_registry = SkillRegistry(skills_dir)  # Parsed SKILL.md cache
         self.tools = {}  # Registry for Python tools (like ObsidianTool)
+        self._tool_factories = {}  # Tools built on first use (see register_tool_factory)
+        self._tools_lock = threading.Lock()
+
+        # Routing index over agent + skill triggers, refreshed when files change
+        self.trigger_index = TriggerIndex()
+        self.trigger_index.set_agents(self.agents)
+        self._config_signature = self._file_signature(self.config_path)
+        self._skills_signature = ()
+        self._routing_lock = threading.RLock()
+
+        # Per-stage tracing; no-op until a sink is attached
+        self.instrumentation = Instrumentation()
+
+        # LLM response cache for agents with `cache: true` (created on first use)
+        self.response_cache = None
+
+        # Prompt size accounting (see build_messages / max_context_tokens)
+        self.context_stats = {'prompts': 0, 'tokens_before': 0, 'tokens_after': 0, 'tokens_saved': 0}
+
+        # Async API state (see ainvoke_agent / orchestrate_many)
+        self.model_concurrency = {}  # model -> max concurrent requests
+        self._model_semaphores = weakref.WeakKeyDictionary()  # event loop -> {(model, limit): Semaphore}
+
+        # Ollama hosts (the `backends` section of agents.yaml; default: one local host)
+        self.pool = None
+        self._build_pool(config.get('backends'))
 
-    def _load_agent_config(self, config_path: str) -> Dict:
-        """Load agent definitions from agents.yaml"""
+    def _read_config(self, config_path) -> Dict:
+        """Parse agents.yaml"""
         with open(config_path) as f:
-            return yaml.safe_load(f)['agents']
+            return yaml.safe_load(f)
+
+    def _build_pool(self, backends_config: Optional[Dict]):
+        """(Re)create the Ollama pool: background health checks, plus warm-up if configured"""
+        if self.pool is not None:
+            self.pool.stop_health_checks()
+        self._backends_config = backends_config
+        self.pool = OllamaPool.from_config(backends_config)
+        self.pool.start_health_checks()
+        if (backends_config or {}).get('warm_up'):
+            threading.Thread(target=self.warm_up, name='ollama-warm-up', daemon=True).start()
+
+    def warm_up(self):
+        """Load every model the configured agents use on the hosts that serve it"""
+        self.pool.warm_up([config['model'] for config in self.agents.values()])
+
+    @staticmethod
+    def _file_signature(path: Path):
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh_routing(self):
+        """
+        Bring the trigger index up to date with agents.yaml and skills_dir.
+        Only skills whose SKILL.md changed are re-indexed. A config that
+        is missing (e.g. an editor's delete-then-write) or fails to parse
+        (saved mid-edit) is reported and the previous agents are kept.
+        """
+        try:
+            config_signature = self._file_signature(self.config_path)
+        except OSError:
+            # Keep routing with the current index; retried on the next call
+            config_signature = self._config_signature
+        if config_signature != self._config_signature:
+            print(f"Reloading agent config: {self.config_path}")
+            try:
+                config = self._read_config(self.config_path)
+                agents = config['agents']
+            except Exception as e:
+                print(f"Warning: could not reload {self.config_path}, keeping previous config: {e}")
+                self._config_signature = config_signature
+                return
+            self.agents = agents
+            self.trigger_index.set_agents(self.agents)
+            if config.get('backends') != self._backends_config:
+                self._build_pool(config.get('backends'))
+            self._config_signature = config_signature
+
+        skills_signature = self.skill_registry.signature()
+        if skills_signature == self._skills_signature:
+            return
+
+        previous = {name: (mtime, size) for name, mtime, size in self._skills_signature}
+        current = {name: (mtime, size) for name, mtime, size in skills_signature}
+
+        for skill_name in previous.keys() - current.keys():
+            self.trigger_index.remove_skill(skill_name)
+
+        for skill_name, file_signature in current.items():
+            if previous.get(skill_name) != file_signature:
+                skill = self.load_skill(skill_name)
+                if skill:
+                    self.trigger_index.set_skill(skill)
+
+        self._skills_signature = skills_signature
+
+    def refresh(self):
+        """Pick up agents.yaml / SKILL.md changes now (select_agent also checks on every call)"""
+        with self._routing_lock:
+            self._refresh_routing()
 
     def register_tool(self, name: str, tool_instance):
         """
@@ -39,34 +160,43 @@ class AgentOrchestrator:
         self.tools[name] = tool_instance
         print(f"Registered tool: {name}")
 
+    def register_tool_factory(self, name: str, factory):
+        """
+        Register a tool that is only constructed the first time a workflow
+        needs it, so startup doesn't pay for heavy imports or setup.
+
+        Args:
+            name: Tool name (as used in `requires_tool`)
+            factory: Zero-argument callable returning the tool instance
+        """
+        self._tool_factories[name] = factory
+        print(f"Registered tool: {name} (lazy)")
+
+    def has_tool(self, name: str) -> bool:
+        return name in self.tools or name in self._tool_factories
+
+    def get_tool(self, name: str):
+        """Registered tool instance, building it from its factory on first use"""
+        tool = self.tools.get(name)
+        if tool is not None or name not in self._tool_factories:
+            return tool
+        with self._tools_lock:
+            if name not in self.tools:
+                print(f"Instantiating tool: {name}")
+                self.tools[name] = self._tool_factories[name]()
+            return self.tools[name]
+
     def load_skill(self, skill_name: str) -> Optional[Dict]:
         """
         Load a single skill by name.
-        Reads the SKILL.md file and extracts metadata + content.
+        Served from the skill registry; SKILL.md is only re-read when it changes.
         """
-        # Skills are stored directly in skills_dir/skill-name/SKILL.md
-        skill_path = self.skills_dir / skill_name / "SKILL.md"
-
-        if not skill_path.exists():
-            print(f"Warning: Skill '{skill_name}' not found at {skill_path}")
-            return None
-
-        with open(skill_path, 'r') as f:
-            content = f.read()
-            metadata = self._parse_skill_metadata(content)
-            return {
-                'name': skill_name,
-                'content': content,
-                'metadata': metadata
-            }
+        with self.instrumentation.span('load_skill', skill=skill_name):
+            return self.skill_registry.get(skill_name)
 
     def _parse_skill_metadata(self, content: str) -> Dict:
         """Extract YAML frontmatter from SKILL.md"""
-        import re
-        match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-        if match:
-            return yaml.safe_load(match.group(1))
-        return {}
+        return parse_skill_metadata(content)
 
     def select_agent(self, query: str) -> str:
         """
@@ -77,39 +207,32 @@ class AgentOrchestrator:
         2. Check if query matches any skill triggers (from SKILL.md files)
         3. Default to general_agent if no match
 
+        Both trigger sets are compiled into one TriggerIndex, so steps 1-2
+        happen in a single pass over the query (see TriggerIndex for the
+        word-boundary and priority rules).
+
         Returns: agent name
         """
-        query_lower = query.lower()
-
-        # Strategy 1: Check agent triggers first
-        for agent_name, agent_config in self.agents.items():
-            triggers = agent_config.get('triggers', [])
-            if any(trigger.lower() in query_lower for trigger in triggers):
-                print(f"Selected agent '{agent_name}' based on agent trigger")
-                return agent_name
-
-        # Strategy 2: Check skill triggers
-        # Scan all skills to see if their triggers match
-        for skill_dir in self.skills_dir.iterdir():
-            if skill_dir.is_dir():
-                skill = self.load_skill(skill_dir.name)
-                if skill:
-                    triggers = skill['metadata'].get('triggers', [])
-                    if any(trigger.lower() in query_lower for trigger in triggers):
-                        # This skill is relevant - check if it requires a tool
-                        if skill['metadata'].get('requires_tool'):
-                            print(f"Selected workflow '{skill['name']}' (requires tool)")
-                            return f"workflow:{skill['name']}"
-
-                        # Find which agent has this skill
-                        for agent_name, agent_config in self.agents.items():
-                            if skill['name'] in agent_config.get('skills', []):
-                                print(f"Selected agent '{agent_name}' based on skill trigger")
-                                return agent_name
-
-        # Default: use general_agent
-        print("No specific agent matched, using general_agent")
-        return 'general_agent'
+        with self.instrumentation.span('select_agent') as span:
+            # Callers may route from several threads (e.g. the server)
+            with self._routing_lock:
+                self._refresh_routing()
+
+                # Single pass over all agent triggers (agents.yaml) and skill triggers (SKILL.md)
+                match = self.trigger_index.route(query)
+            if match:
+                target, source = match
+                if source == 'workflow':
+                    print(f"Selected workflow '{target.split(':', 1)[1]}' (requires tool)")
+                else:
+                    print(f"Selected agent '{target}' based on {source} trigger")
+                span.set(selection=target, source=source)
+                return target
+
+            # Default: use general_agent
+            print("No specific agent matched, using general_agent")
+            span.set(selection='general_agent', source='default')
+            return 'general_agent'
 
     def load_agent_skills(self, agent_name: str) -> List[Dict]:
         """
@@ -127,9 +250,68 @@ class AgentOrchestrator:
 
         return skills
 
+    def build_messages(self, agent_name: str, query: str,
+                       skills: List[Dict] = None,
+                       context: Optional[str] = None) -> List[Dict]:
+        """
+        Build the message chain for an agent call: system prompt (agent
+        personality + skills), optional context, then the user query.
+        Shared by invoke_agent and ainvoke_agent.
+
+        Skill frontmatter is stripped. If the agent sets `max_context_tokens`
+        in agents.yaml, skill sections least relevant to the query are
+        dropped until the whole prompt fits (see ContextBudget).
+        """
+        with self.instrumentation.span('prompt_build', agent=agent_name) as span:
+            agent_config = self.agents[agent_name]
+
+            # If skills not provided, load the agent's default skills
+            if skills is None:
+                skills = self.load_agent_skills(agent_name)
+
+            # Build system prompt: agent's personality + skills
+            system_prompt = agent_config.get('system_prompt', '')
+
+            if skills:
+                header = "\n\n# Your Available Skills:\n"
+                max_tokens = agent_config.get('max_context_tokens')
+                skill_budget = None
+                if max_tokens:
+                    fixed = system_prompt + header + query + (context or '')
+                    skill_budget = max(0, max_tokens - estimate_tokens(fixed))
+
+                contents, report = compact_skills(skills, query, skill_budget)
+                self._record_context(agent_name, report)
+
+                system_prompt += header
+                for content in contents:
+                    system_prompt += f"\n{content}\n"
+
+            # Build message chain
+            messages = [{'role': 'system', 'content': system_prompt}]
+
+            if context:
+                messages.append({'role': 'user', 'content': f"Context:\n{context}"})
+
+            messages.append({'role': 'user', 'content': query})
+
+            span.set(prompt_chars=sum(len(m['content']) for m in messages))
+            return messages
+
+    def _record_context(self, agent_name: str, report: Dict):
+        """Accumulate prompt token savings from skill compaction"""
+        saved = report['before'] - report['after']
+        self.context_stats['prompts'] += 1
+        self.context_stats['tokens_before'] += report['before']
+        self.context_stats['tokens_after'] += report['after']
+        self.context_stats['tokens_saved'] += saved
+        if saved > 0 and self.agents[agent_name].get('max_context_tokens'):
+            print(f"Compacted skills for '{agent_name}': ~{report['before']} -> ~{report['after']} tokens")
+
     def invoke_agent(self, agent_name: str, query: str,
                      skills: List[Dict] = None,
-                     context: Optional[str] = None) -> str:
+                     context: Optional[str] = None,
+                     stream: bool = False) -> Union[str, AgentStream]:
         """
         Call a specific agent to process the query.
 
@@ -138,46 +320,114 @@ class AgentOrchestrator:
             query: User's question/request
             skills: Optional list of skills to load (if None, loads agent's default skills)
             context: Optional context from previous agent responses
+            stream: If True, return an AgentStream that yields content chunks
+                as they're generated (and records time-to-first-token)
         """
         agent_config = self.agents[agent_name]
+        messages = self.build_messages(agent_name, query, skills, context)
+
+        # Identical prompt seen before? (agents with `cache: true` only)
+        cache_key, cached = self._cached_response(agent_name, messages)
+        if cached is not None:
+            return AgentStream([cached]) if stream else cached
+
+        if stream:
+            # The call only finishes when the caller drains the stream, so the
+            # ollama_chat span and cache entry are recorded from AgentStream's
+            # completion hook
+            started = time.time()
+            response = self.pool.chat(
+                model=agent_config['model'],
+                messages=messages,
+                options=agent_config.get('options'),
+                stream=True
+            )
+
+            def on_complete(s: AgentStream):
+                if cache_key and s.content:
+                    self.response_cache.put(cache_key, s.content, agent_config['model'], s.elapsed)
+                self.instrumentation.record(
+                    'ollama_chat', started, s.elapsed, s.final,
+                    agent=agent_name, model=agent_config['model'], stream=True,
+                    time_to_first_token=s.time_to_first_token)
+            # Keep the text for the cache even if the caller streams it to a file
+            return AgentStream(response, on_complete=on_complete, keep_content=bool(cache_key))
 
-        # If skills not provided, load the agent's default skills
-        if skills is None:
-            skills = self.load_agent_skills(agent_name)
+        # Call the LLM
+        started = time.perf_counter()
+        with self.instrumentation.span('ollama_chat', agent=agent_name, model=agent_config['model']) as span:
+            response = self.pool.chat(
+                model=agent_config['model'],
+                messages=messages,
+                options=agent_config.get('options')
+            )
+            span.record_llm(response)
+
+        content = response['message']['content']
+        if cache_key:
+            self.response_cache.put(cache_key, content, agent_config['model'], time.perf_counter() - started)
+        return content
+
+    def _cached_response(self, agent_name: str, messages: List[Dict]):
+        """
+        Look up a response in the LLM response cache.
 
-        # Build system prompt: agent's personality + skills
-        system_prompt = agent_config.get('system_prompt', '')
+        Returns: (cache key, cached content). The key is None if the agent
+        hasn't opted in with `cache: true`; content is None on a miss.
+        """
+        agent_config = self.agents[agent_name]
+        if not agent_config.get('cache'):
+            return None, None
 
-        if skills:
-            system_prompt += "\n\n# Your Available Skills:\n"
-            for skill in skills:
-                system_prompt += f"\n{skill['content']}\n"
+        if self.response_cache is None:
+            self.response_cache = ResponseCache()
 
-        # Build message chain
-        messages = [{'role': 'system', 'content': system_prompt}]
+        key = response_key(agent_config['model'], messages, agent_config.get('options'))
+        content = self.response_cache.get(key, agent_config.get('cache_ttl'))
+        if content is not None:
+            print(f"Using cached response for '{agent_name}'")
+        return key, content
 
-        if context:
-            messages.append({'role': 'user', 'content': f"Context:\n{context}"})
+    def execute_tool(self, tool_name: str, **kwargs) -> str:
+        """Execute a registered Python tool"""
+        if not self.has_tool(tool_name):
+            return f"Error: Tool '{tool_name}' not found"
 
-        messages.append({'role': 'user', 'content': query})
+        tool = self.get_tool(tool_name)
+        with self.instrumentation.span('execute_tool', tool=tool_name):
+            return tool.execute(**kwargs)
 
-        # Call the LLM
-        response = ollama.chat(
-            model=agent_config['model'],
-            messages=messages
-        )
+    def _resolve_workflow(self, selection: str):
+        """
+        Work out which tool runs a 'workflow:<skill>' selection and which
+        skills it needs.
 
-        return response['message']['content']
+        Returns: (tool_name, skills), or (None, error message) if the tool
+        isn't registered.
+        """
+        skill_name = selection.split(':', 1)[1]
+        skill = self.load_skill(skill_name)
+        tool_name = skill['metadata'].get('requires_tool')
 
-    def execute_tool(self, tool_name: str, **kwargs) -> str:
-        """Execute a registered Python tool"""
-        if tool_name not in self.tools:
-            return f"Error: Tool '{tool_name}' not found"
+        if not (tool_name and self.has_tool(tool_name)):
+            return None, f"Error: Workflow '{skill_name}' requires tool '{tool_name}' which is not registered"
+
+        # The tool will orchestrate everything (like ObsidianTool does)
+        # Load all skills that might be needed by the tool's agents
+        all_skills = [skill]
 
-        tool = self.tools[tool_name]
-        return tool.execute(**kwargs)
+        # For obsidian-integration, also load skills for doc_agent and research_agent
+        if skill_name == 'obsidian-integration':
+            # doc_agent skills, then research_agent skills
+            for extra in ['daily-summary', 'markdown-processing', 'open-research', 'web-search']:
+                s = self.load_skill(extra)
+                if s:
+                    all_skills.append(s)
 
-    def orchestrate(self, user_query: str) -> str:
+        print(f"Loading {len(all_skills)} skills for tool: {[s['name'] for s in all_skills]}")
+        return tool_name, all_skills
+
+    def orchestrate(self, user_query: str, selection: Optional[str] = None) -> str:
         """
         Main entry point: route a user query to the right agent or tool.
 
@@ -185,40 +435,183 @@ class AgentOrchestrator:
         1. Select appropriate agent/workflow
         2. If it's a tool workflow, execute the tool
         3. Otherwise, invoke the agent with its skills
+
+        Args:
+            user_query: The user's query
+            selection: Skip step 1 with an earlier select_agent() result
+        """
+        with self.instrumentation.span('orchestrate'):
+            # Step 1: Decide which agent or workflow should handle this
+            if selection is None:
+                selection = self.select_agent(user_query)
+
+            # Step 2: If it's a workflow (requires a tool), execute the tool
+            if selection.startswith('workflow:'):
+                tool_name, result = self._resolve_workflow(selection)
+                if tool_name is None:
+                    return result
+                return self.execute_tool(tool_name, query=user_query, skills=result)
+
+            # Step 3: Otherwise, invoke the selected agent
+            # The agent will automatically load its skills from agents.yaml
+            return self.invoke_agent(selection, user_query)
+
+    def orchestrate_stream(self, user_query: str) -> AgentStream:
+        """
+        Streaming version of orchestrate.
+
+        Agents stream tokens as they're generated. Tool workflows stream
+        if the tool has an `execute_stream(**kwargs)` generator (e.g. one
+        section of the daily summary at a time); otherwise the tool's full
+        result arrives as a single chunk.
         """
-        # Step 1: Decide which agent or workflow should handle this
         selection = self.select_agent(user_query)
 
-        # Step 2: If it's a workflow (requires a tool), execute the tool
         if selection.startswith('workflow:'):
-            skill_name = selection.split(':', 1)[1]
-            skill = self.load_skill(skill_name)
-            tool_name = skill['metadata'].get('requires_tool')
-
-            if tool_name and tool_name in self.tools:
-                # The tool will orchestrate everything (like ObsidianTool does)
-                # Load all skills that might be needed by the tool's agents
-                all_skills = [skill]
-
-                # For obsidian-integration, also load skills for doc_agent and research_agent
-                if skill_name == 'obsidian-integration':
-                    # Load skills for doc_agent
-                    for skill_name in ['daily-summary', 'markdown-processing']:
-                        s = self.load_skill(skill_name)
-                        if s:
-                            all_skills.append(s)
-
-                    # Load skills for research_agent
-                    for skill_name in ['open-research', 'web-search']:
-                        s = self.load_skill(skill_name)
-                        if s:
-                            all_skills.append(s)
-
-                print(f"Loading {len(all_skills)} skills for tool: {[s['name'] for s in all_skills]}")
-                return self.execute_tool(tool_name, query=user_query, skills=all_skills)
-            else:
-                return f"Error: Workflow '{skill_name}' requires tool '{tool_name}' which is not registered"
-
-        # Step 3: Otherwise, invoke the selected agent
-        # The agent will automatically load its skills from agents.yaml
-        return self.invoke_agent(selection, user_query)
\ No newline at end of file
+            tool_name, result = self._resolve_workflow(selection)
+            if tool_name is None:
+                return AgentStream([result])
+            return AgentStream(self._execute_tool_stream(tool_name, query=user_query, skills=result))
+
+        return self.invoke_agent(selection, user_query, stream=True)
+
+    def _execute_tool_stream(self, tool_name: str, **kwargs) -> Iterator[str]:
+        """Yield a tool's output incrementally when it supports execute_stream"""
+        tool = self.get_tool(tool_name)
+        if hasattr(tool, 'execute_stream'):
+            yield from tool.execute_stream(**kwargs)
+        else:
+            yield tool.execute(**kwargs)
+
+    # ------------------------------------------------------------------
+    # Async API
+    #
+    # Mirrors invoke_agent / execute_tool / orchestrate on top of
+    # ollama.AsyncClient (via OllamaPool) so many queries can share one orchestrator and
+    # keep the Ollama server busy. Routing and skill loading stay sync -
+    # they're in-memory after the first call.
+    # ------------------------------------------------------------------
+
+    def _model_semaphore(self, model: str) -> Optional[asyncio.Semaphore]:
+        """
+        Per-model concurrency limit (None = unlimited): the current
+        orchestrate_many batch's override if it has one, otherwise
+        self.model_concurrency.
+        """
+        batch = _batch_semaphores.get()
+        if batch and model in batch:
+            return batch[model]
+
+        limit = self.model_concurrency.get(model)
+        if not limit:
+            return None
+        # asyncio primitives belong to one event loop
+        semaphores = self._model_semaphores.setdefault(asyncio.get_running_loop(), {})
+        if (model, limit) not in semaphores:
+            semaphores[(model, limit)] = asyncio.Semaphore(limit)
+        return semaphores[(model, limit)]
+
+    async def ainvoke_agent(self, agent_name: str, query: str,
+                            skills: List[Dict] = None,
+                            context: Optional[str] = None) -> str:
+        """Async version of invoke_agent"""
+        agent_config = self.agents[agent_name]
+        messages = self.build_messages(agent_name, query, skills, context)
+
+        cache_key, cached = self._cached_response(agent_name, messages)
+        if cached is not None:
+            return cached
+
+        request = dict(model=agent_config['model'], messages=messages, options=agent_config.get('options'))
+
+        semaphore = self._model_semaphore(agent_config['model'])
+        queued = time.perf_counter()
+        async with semaphore if semaphore is not None else contextlib.nullcontext():
+            # The span covers the request only; time spent waiting for the
+            # per-model limit is reported separately as queue_wait_ms
+            started = time.perf_counter()
+            with self.instrumentation.span('ollama_chat', agent=agent_name, model=agent_config['model'],
+                                           queue_wait_ms=round((started - queued) * 1000, 3)) as span:
+                response = await self.pool.achat(**request)
+                span.record_llm(response)
+
+        content = response['message']['content']
+        if cache_key:
+            self.response_cache.put(cache_key, content, agent_config['model'], time.perf_counter() - started)
+        return content
+
+    async def aexecute_tool(self, tool_name: str, **kwargs) -> str:
+        """
+        Async version of execute_tool.
+        Uses the tool's own `aexecute` coroutine if it has one, otherwise
+        runs `execute` in a worker thread so the event loop isn't blocked.
+        """
+        if not self.has_tool(tool_name):
+            return f"Error: Tool '{tool_name}' not found"
+
+        tool = self.get_tool(tool_name)
+        with self.instrumentation.span('execute_tool', tool=tool_name):
+            if hasattr(tool, 'aexecute'):
+                return await tool.aexecute(**kwargs)
+            return await asyncio.to_thread(tool.execute, **kwargs)
+
+    async def aorchestrate(self, user_query: str) -> str:
+        """Async version of orchestrate"""
+        with self.instrumentation.span('orchestrate'):
+            selection = self.select_agent(user_query)
+
+            if selection.startswith('workflow:'):
+                tool_name, result = self._resolve_workflow(selection)
+                if tool_name is None:
+                    return result
+                return await self.aexecute_tool(tool_name, query=user_query, skills=result)
+
+            return await self.ainvoke_agent(selection, user_query)
+
+    async def orchestrate_many(self, queries: List[str], concurrency: int = 4,
+                               timeout: Optional[float] = None,
+                               model_concurrency: Optional[Dict[str, int]] = None) -> List[str]:
+        """
+        Run a batch of queries through aorchestrate with bounded concurrency.
+
+        Args:
+            queries: User queries to process
+            concurrency: Max queries in flight at once
+            timeout: Optional per-query timeout in seconds
+            model_concurrency: Optional {model: limit} overrides for this batch
+                only (other callers keep using self.model_concurrency)
+
+        Returns: one result per query, in input order. Queries that time out
+        or fail return an "Error: ..." string like the sync API does.
+        Cancelling the awaiting task cancels every query still in flight.
+
+        Raises: ValueError if concurrency or a model_concurrency limit isn't
+        an integer >= 1 (a limit of 0 would block the batch forever).
+
+        Usage:
+            results = asyncio.run(orchestrator.orchestrate_many(queries, concurrency=8))
+        """
+        model_concurrency = model_concurrency or {}
+        _check_limit('concurrency', concurrency)
+        for model, limit in model_concurrency.items():
+            _check_limit(f"model_concurrency[{model!r}]", limit)
+
+        batch = asyncio.Semaphore(concurrency)
+
+        async def run_one(query: str) -> str:
+            async with batch:
+                try:
+                    return await asyncio.wait_for(self.aorchestrate(query), timeout)
+                except asyncio.TimeoutError:
+                    return f"Error: Query timed out after {timeout}s"
+                except Exception as e:
+                    return f"Error: {e}"
+
+        # The batch's tasks copy this context when gather creates them
+        token = _batch_semaphores.set(
+            {model: asyncio.Semaphore(limit) for model, limit in model_concurrency.items()}
+        )
+        try:
+            return await asyncio.gather(*(run_one(q) for q in queries))
+        finally:
+            _batch_semaphores.reset(token)
@@ -0,0 +1,80 @@
+# agents/orchestrator/AgentStream.py
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Dict
+
+
+class AgentStream:
+    """
+    Streamed agent output.
+
+    Iterate over it to get content chunks as the model produces them.
+    Timing is recorded from the moment the stream is created:
+    - time_to_first_token: seconds until the first non-empty chunk
+    - elapsed: seconds until the stream was exhausted
+    After iteration, `content` holds the full text and `final` the last
+    raw Ollama response (with eval_count, eval_duration, ...), if any.
+
+    Usage:
+        stream = orchestrator.invoke_agent('research_agent', query, stream=True)
+        for chunk in stream:
+            print(chunk, end='', flush=True)
+        print(f"\\nTTFT: {stream.time_to_first_token:.2f}s")
+    """
+
+    def __init__(self, chunks: Iterable,
+                 on_complete: Optional[Callable[['AgentStream'], None]] = None,
+                 keep_content: bool = False):
+        """
+        Args:
+            chunks: Raw ollama.chat(stream=True) responses, or plain strings
+                (e.g. sections yielded by a tool's execute_stream)
+            on_complete: Optional callback run with this stream once it's exhausted
+            keep_content: Keep `content` even when consumed with write_to
+                (e.g. so the completion hook can cache the full response)
+        """
+        self._chunks = chunks
+        self._on_complete = on_complete
+        self.keep_content = keep_content
+        self._parts = []
+        self._started = time.perf_counter()
+        self.time_to_first_token: Optional[float] = None
+        self.elapsed: Optional[float] = None
+        self.final: Optional[Dict] = None
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self._chunks:
+            if isinstance(chunk, str):
+                text = chunk
+            else:
+                self.final = chunk
+                text = chunk['message']['content']
+            if not text:
+                continue
+            if self.time_to_first_token is None:
+                self.time_to_first_token = time.perf_counter() - self._started
+            self._parts.append(text)
+            yield text
+        self.elapsed = time.perf_counter() - self._started
+        if self._on_complete:
+            self._on_complete(self)
+
+    @property
+    def content(self) -> str:
+        """Everything streamed so far (not kept when using write_to, unless keep_content)"""
+        return ''.join(self._parts)
+
+    def write_to(self, path: str, mode: str = 'w') -> str:
+        """
+        Consume the stream, writing each chunk to `path` as it arrives
+        (flushed, so partial output is visible while the model is still
+        generating). Chunks aren't kept in memory unless keep_content is
+        set. Returns the path.
+        """
+        with open(Path(path), mode) as f:
+            for text in self:
+                f.write(text)
+                f.flush()
+                if not self.keep_content:
+                    self._parts.pop()
+        return str(path)
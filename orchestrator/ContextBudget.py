@@ -0,0 +1,162 @@
+# agents/orchestrator/ContextBudget.py
+import re
+from typing import List, Dict, Optional, Tuple
+
+from orchestrator.SkillRegistry import FRONTMATTER_RE
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+HEADING_RE = re.compile(r'^#{1,6}\s', re.MULTILINE)
+
+# Words too common to say anything about relevance
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'are', 'was', 'you',
+    'your', 'what', 'how', 'about', 'into', 'can', 'use', 'all', 'any', 'not',
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count (~4 characters per token for English with llama-style
+    tokenizers). Good enough for budgeting; Ollama's prompt_eval_count is
+    the exact figure after the call.
+    """
+    return (len(text) + 3) // 4
+
+
+def terms(text: str) -> set:
+    """Lowercase content words used for relevance scoring"""
+    return {w for w in WORD_RE.findall(text.lower()) if len(w) > 2 and w not in STOPWORDS}
+
+
+def strip_frontmatter(content: str) -> str:
+    """Drop the YAML frontmatter (routing metadata the model doesn't need)"""
+    match = FRONTMATTER_RE.match(content)
+    if match:
+        return content[match.end():].lstrip('\n')
+    return content
+
+
+def split_sections(content: str) -> List[str]:
+    """Split markdown into sections at headings; text before the first heading is its own section"""
+    starts = [m.start() for m in HEADING_RE.finditer(content)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    starts.append(len(content))
+    return [content[a:b].strip('\n') for a, b in zip(starts, starts[1:]) if content[a:b].strip()]
+
+
+def compact_skills(skills: List[Dict], query: str,
+                   max_tokens: Optional[int]) -> Tuple[List[str], Dict]:
+    """
+    Fit skill content into a token budget.
+
+    Frontmatter is always stripped. If a budget is given and the skills
+    still don't fit, each skill keeps its first section (title/overview,
+    even over budget) and the remaining sections are added
+    most-relevant-to-the-query first until the budget runs out.
+    Sections keep their original order.
+
+    Returns: (compacted content per skill, {'before', 'after'} token counts)
+    """
+    before = sum(estimate_tokens(skill['content']) for skill in skills)
+    bodies = [strip_frontmatter(skill['content']) for skill in skills]
+
+    if max_tokens is None or sum(estimate_tokens(b) for b in bodies) <= max_tokens:
+        return bodies, {'before': before, 'after': sum(estimate_tokens(b) for b in bodies)}
+
+    query_terms = terms(query)
+    candidates = []  # (priority, skill index, section index, text)
+    sections = [split_sections(body) for body in bodies]
+    for i, skill_sections in enumerate(sections):
+        for j, text in enumerate(skill_sections):
+            score = float('inf') if j == 0 else len(query_terms & terms(text))
+            candidates.append((-score, i, j, text))
+
+    kept = set()
+    used = 0
+    for _, i, j, text in sorted(candidates):
+        cost = estimate_tokens(text) + 1
+        # Overviews are always kept so the agent knows every skill exists
+        if j == 0 or used + cost <= max_tokens:
+            kept.add((i, j))
+            used += cost
+
+    compacted = [
+        '\n\n'.join(text for j, text in enumerate(skill_sections) if (i, j) in kept)
+        for i, skill_sections in enumerate(sections)
+    ]
+    return compacted, {'before': before, 'after': sum(estimate_tokens(c) for c in compacted)}
+
+
+def fit_search_results(query: str, results: List[Dict], max_tokens: Optional[int],
+                       min_snippet_chars: int = 80) -> List[Dict]:
+    """
+    Rank search results by overlap with the query and trim them to a budget.
+
+    Results are sorted by relevance (ties keep the search engine's order).
+    Results are added whole while they fit; the first one that doesn't fit
+    gets its snippet truncated (if at least min_snippet_chars remain) and
+    the rest are dropped.
+
+    Args:
+        query: The search query
+        results: [{'title', 'url', 'snippet'}] from the search tool
+        max_tokens: Token budget for all results (None = rank only)
+    """
+    if not results or 'error' in results[0]:
+        return results
+
+    query_terms = terms(query)
+    ranked = sorted(
+        enumerate(results),
+        key=lambda item: (-len(query_terms & terms(f"{item[1].get('title', '')} {item[1].get('snippet', '')}")),
+                          item[0])
+    )
+    ranked = [result for _, result in ranked]
+    if max_tokens is None:
+        return ranked
+
+    fitted = []
+    used = 0
+    for result in ranked:
+        cost = estimate_tokens(f"{result.get('title', '')} {result.get('url', '')} {result.get('snippet', '')}") + 8
+        if used + cost <= max_tokens:
+            fitted.append(result)
+            used += cost
+            continue
+
+        remaining_chars = (max_tokens - used - 8) * 4 - len(result.get('title', '')) - len(result.get('url', ''))
+        if remaining_chars >= min_snippet_chars:
+            fitted.append({**result, 'snippet': result.get('snippet', '')[:remaining_chars].rstrip() + '...'})
+        break
+
+    return fitted
+
+
+def best_passages(query: str, paragraphs: List[str], max_chars: int) -> str:
+    """
+    Pick the paragraphs of a page most relevant to the query, within
+    max_chars. Paragraphs are ranked by query-term overlap (ties keep page
+    order) and joined in page order; with no overlap at all the page's
+    leading paragraphs are used.
+    """
+    query_terms = terms(query)
+    ranked = sorted(
+        enumerate(paragraphs),
+        key=lambda item: (-len(query_terms & terms(item[1])), item[0])
+    )
+
+    kept = []
+    used = 0
+    for index, text in ranked:
+        cost = len(text) + (2 if kept else 0)  # '\n\n' separator
+        if used + cost > max_chars:
+            if not kept and max_chars > 3:
+                # The best paragraph alone is too long: keep its start, and nothing else
+                kept.append((index, text[:max_chars - 3].rstrip() + '...'))
+                break
+            continue
+        kept.append((index, text))
+        used += cost
+
+    return '\n\n'.join(text for _, text in sorted(kept))
@@ -0,0 +1,315 @@
+# agents/orchestrator/Instrumentation.py
+import contextvars
+import functools
+import itertools
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Ollama response fields worth keeping (durations are nanoseconds)
+LLM_FIELDS = ('prompt_eval_count', 'prompt_eval_duration', 'eval_count',
+              'eval_duration', 'load_duration', 'total_duration')
+
+_current_span = contextvars.ContextVar('current_span', default=None)
+_ids = itertools.count(1)
+
+
+class Span:
+    """
+    Timing span for one stage. Attributes can be added while it's open;
+    the finished span is emitted to every sink as a dict:
+    {stage, trace_id, span_id, parent_id, start, duration_ms, attrs, error?}
+    """
+
+    __slots__ = ('instrumentation', 'stage', 'attrs', 'span_id', 'parent_id',
+                 'trace_id', 'start', '_t0', '_token')
+
+    def __init__(self, instrumentation, stage: str, attrs: Dict):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def record_llm(self, response):
+        """Copy Ollama's token counts and durations from a chat response"""
+        if response is None:
+            return
+        for field in LLM_FIELDS:
+            value = response.get(field) if hasattr(response, 'get') else getattr(response, field, None)
+            if value is not None:
+                self.attrs[field] = value
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.span_id = next(_ids)
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else self.span_id
+        self._token = _current_span.set(self)
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+        self.instrumentation.started(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._t0
+        _current_span.reset(self._token)
+        event = {
+            'stage': self.stage,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': self.start,
+            'duration_ms': round(duration * 1000, 3),
+            'attrs': self.attrs,
+        }
+        if exc_type is not None:
+            event['error'] = f"{exc_type.__name__}: {exc}"
+        self.instrumentation.emit(event)
+        return False
+
+
+class _NoopSpan:
+    """Shared do-nothing span used when no sinks are attached"""
+
+    def set(self, **attrs):
+        pass
+
+    def record_llm(self, response):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Instrumentation:
+    """
+    Pluggable per-stage tracing.
+
+    Stages instrumented by AgentOrchestrator: select_agent, load_skill,
+    prompt_build, ollama_chat, execute_tool (plus orchestrate as the
+    parent span). Other callables, such as the web search tool's
+    search_duckduckgo, can be traced with wrap().
+
+    With no sinks attached, span() returns a shared no-op object, so
+    disabled instrumentation costs one attribute check per stage.
+
+    Usage:
+        metrics = MetricsAggregator()
+        orchestrator.instrumentation.add_sink(metrics)
+        orchestrator.instrumentation.add_sink(JsonlSink("traces.jsonl"))
+        ...
+        print(metrics.summary())
+    """
+
+    def __init__(self, sinks: Optional[List] = None):
+        self.sinks = list(sinks or [])
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sinks)
+
+    def add_sink(self, sink):
+        """
+        Attach a sink: any object with a record(event: Dict) method, called
+        when a span finishes, and optionally on_start(span), called when
+        one opens (for sinks that build live span trees, like OpenTelemetrySink)
+        """
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink):
+        self.sinks.remove(sink)
+
+    def span(self, stage: str, **attrs):
+        """Context manager timing one stage"""
+        if not self.sinks:
+            return NOOP_SPAN
+        return Span(self, stage, attrs)
+
+    def record(self, stage: str, start: float, duration: Optional[float],
+               response=None, **attrs):
+        """
+        Record an already-finished stage, for work that doesn't fit a
+        `with` block (e.g. a streamed response drained later by the caller).
+
+        Args:
+            start: Epoch seconds when the stage began
+            duration: Seconds it took
+            response: Optional Ollama response to take token counts from
+        """
+        if not self.sinks:
+            return
+        span = Span(self, stage, attrs)
+        span.record_llm(response)
+        parent = _current_span.get()
+        self.emit({
+            'stage': stage,
+            'trace_id': parent.trace_id if parent else next(_ids),
+            'span_id': next(_ids),
+            'parent_id': parent.span_id if parent else None,
+            'start': start,
+            'duration_ms': round((duration or 0.0) * 1000, 3),
+            'attrs': span.attrs,
+        })
+
+    def started(self, span: Span):
+        """Tell sinks with an on_start(span) method that a span has opened"""
+        for sink in self.sinks:
+            if hasattr(sink, 'on_start'):
+                try:
+                    sink.on_start(span)
+                except Exception as e:
+                    print(f"Warning: instrumentation sink {type(sink).__name__} failed: {e}")
+
+    def emit(self, event: Dict):
+        for sink in self.sinks:
+            try:
+                sink.record(event)
+            except Exception as e:
+                print(f"Warning: instrumentation sink {type(sink).__name__} failed: {e}")
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        """
+        Trace every call to fn as `stage`, e.g.:
+            tool.search_duckduckgo = instrumentation.wrap('search_duckduckgo', tool.search_duckduckgo)
+        """
+        @functools.wraps(fn)
+        def traced(*args, **kwargs):
+            if not self.sinks:
+                return fn(*args, **kwargs)
+            with self.span(stage):
+                return fn(*args, **kwargs)
+        return traced
+
+
+class JsonlSink:
+    """Append one JSON object per finished span to a file"""
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, 'a')
+        self._lock = threading.Lock()
+
+    def record(self, event: Dict):
+        line = json.dumps(event, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def _percentile(ordered: List[float], p: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class MetricsAggregator:
+    """
+    In-process aggregation of spans:
+    - p50/p95 latency per stage
+    - tokens/sec, prompt tokens/sec and model load time per (model, agent)
+    """
+
+    def __init__(self, window: int = 10000):
+        """
+        Args:
+            window: Latency samples kept per stage (oldest dropped first)
+        """
+        self.window = window
+        self._latencies = defaultdict(lambda: deque(maxlen=self.window))
+        self._llm = defaultdict(lambda: defaultdict(float))
+        self._lock = threading.Lock()
+
+    def record(self, event: Dict):
+        attrs = event['attrs']
+        with self._lock:
+            self._latencies[event['stage']].append(event['duration_ms'])
+            if 'eval_count' in attrs:
+                key = (attrs.get('model'), attrs.get('agent'))
+                llm = self._llm[key]
+                llm['calls'] += 1
+                for field in LLM_FIELDS:
+                    llm[field] += attrs.get(field, 0) or 0
+
+    def summary(self) -> Dict:
+        with self._lock:
+            stages = {}
+            for stage, samples in self._latencies.items():
+                ordered = sorted(samples)
+                stages[stage] = {
+                    'count': len(ordered),
+                    'p50_ms': _percentile(ordered, 50),
+                    'p95_ms': _percentile(ordered, 95),
+                }
+
+            models = {}
+            for (model, agent), llm in self._llm.items():
+                eval_s = llm['eval_duration'] / 1e9
+                prompt_s = llm['prompt_eval_duration'] / 1e9
+                models[f"{model}/{agent}"] = {
+                    'calls': int(llm['calls']),
+                    'prompt_tokens': int(llm['prompt_eval_count']),
+                    'generated_tokens': int(llm['eval_count']),
+                    'tokens_per_sec': round(llm['eval_count'] / eval_s, 2) if eval_s else None,
+                    'prompt_tokens_per_sec': round(llm['prompt_eval_count'] / prompt_s, 2) if prompt_s else None,
+                    'load_s': round(llm['load_duration'] / 1e9, 3),
+                }
+
+        return {'stages': stages, 'llm': models}
+
+
+class OpenTelemetrySink:
+    """
+    Export spans through OpenTelemetry (requires: pip install opentelemetry-sdk).
+    Configure the tracer provider/exporter as usual; this sink only creates spans.
+
+    OTel spans are started when our spans open, as children of the parent
+    span's OTel span, so each orchestrate() call shows up as one trace.
+    """
+
+    def __init__(self, tracer_name: str = 'agent-orchestrator'):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("OpenTelemetrySink requires: pip install opentelemetry-sdk")
+        self._trace = trace
+        self._tracer = trace.get_tracer(tracer_name)
+        self._open = {}  # our span_id -> open OTel span
+        self._lock = threading.Lock()
+
+    def _start(self, stage: str, parent_id: Optional[int], start: float):
+        with self._lock:
+            parent = self._open.get(parent_id)
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        return self._tracer.start_span(stage, context=context, start_time=int(start * 1e9))
+
+    def on_start(self, span: Span):
+        otel_span = self._start(span.stage, span.parent_id, span.start)
+        with self._lock:
+            self._open[span.span_id] = otel_span
+
+    def record(self, event: Dict):
+        with self._lock:
+            otel_span = self._open.pop(event['span_id'], None)
+        if otel_span is None:
+            # Recorded after the fact (Instrumentation.record) - never opened
+            otel_span = self._start(event['stage'], event['parent_id'], event['start'])
+
+        for key, value in event['attrs'].items():
+            if isinstance(value, (str, bool, int, float)):
+                otel_span.set_attribute(key, value)
+        if 'error' in event:
+            otel_span.set_attribute('error', event['error'])
+        otel_span.end(end_time=int(event['start'] * 1e9) + int(event['duration_ms'] * 1e6))
@@ -0,0 +1,316 @@
+# agents/orchestrator/OllamaPool.py
+import asyncio
+import threading
+import time
+import weakref
+from typing import Dict, Iterator, List, Optional
+
+import httpx
+import ollama
+
+
+def _is_failover_error(e: Exception) -> bool:
+    """Errors worth retrying on another host: unreachable, model missing, server error"""
+    if isinstance(e, (ConnectionError, httpx.TransportError)):
+        return True
+    if isinstance(e, ollama.ResponseError):
+        return e.status_code == 404 or e.status_code >= 500
+    return False
+
+
+class OllamaBackend:
+    """One Ollama endpoint with a persistent client and load/health state"""
+
+    def __init__(self, url: Optional[str] = None, models: Optional[List[str]] = None):
+        """
+        Args:
+            url: Ollama host (None = ollama's default / OLLAMA_HOST)
+            models: Models this host serves (None = any model)
+        """
+        self.url = url
+        self.models = set(models) if models else None
+        self.client = ollama.Client(host=url)
+        self._async_clients = weakref.WeakKeyDictionary()  # event loop -> (AsyncClient, closer)
+        self.outstanding = 0
+        self.healthy = True
+        self.resident = set()      # models currently loaded in memory (from /api/ps)
+        self.last_check = 0.0
+        self.last_error = None
+
+    @property
+    def name(self) -> str:
+        return self.url or 'default'
+
+    def serves(self, model: str) -> bool:
+        return self.models is None or model in self.models
+
+    async def async_client(self) -> ollama.AsyncClient:
+        """
+        The running loop's AsyncClient (its connection pool is loop-bound).
+        Reused for the life of the loop and closed when the loop shuts
+        down (asyncio.run / loop.shutdown_asyncgens), so batches on
+        different loops don't leak each other's connections.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            client = ollama.AsyncClient(host=self.url)
+            closer = self._close_at_shutdown(loop, client)
+            entry = self._async_clients[loop] = (client, closer)
+            await closer.__anext__()  # registers it with the loop's async generators
+        return entry[0]
+
+    async def _close_at_shutdown(self, loop, client: ollama.AsyncClient):
+        """Suspended until the loop's shutdown_asyncgens() closes it"""
+        try:
+            yield
+        finally:
+            self._async_clients.pop(loop, None)
+            await client._client.aclose()
+
+    def check(self) -> bool:
+        """Health check: ask the host which models are loaded"""
+        self.last_check = time.monotonic()
+        try:
+            running = self.client.ps()
+            self.resident = {m.model for m in running.models}
+            self.healthy = True
+            self.last_error = None
+        except Exception as e:
+            self.healthy = False
+            self.last_error = str(e)
+        return self.healthy
+
+
+class OllamaPool:
+    """
+    Pool of Ollama hosts shared by all agents.
+
+    - Persistent ollama.Client / AsyncClient per host
+    - Least-outstanding-requests scheduling; among equally loaded hosts,
+      those with the model already resident (no load_duration) go first
+    - Failover to the next host on connection errors, missing models or
+      server errors; failed hosts are re-checked after `health_interval`
+    - keep_alive on every request, plus optional warm-up so models are
+      loaded before the first query
+
+    Configured from the `backends` section of agents.yaml:
+        backends:
+          keep_alive: 30m
+          warm_up: true
+          health_interval: 30
+          hosts:
+            - url: http://localhost:11434
+            - url: http://gpu-box:11434
+              models: [gpt-oss:20b]
+
+    Without a `backends` section the pool has a single host (ollama's
+    default, i.e. OLLAMA_HOST or localhost:11434).
+    """
+
+    def __init__(self, hosts: Optional[List[Dict]] = None,
+                 keep_alive: Optional[str] = None,
+                 health_interval: float = 30.0):
+        """
+        Args:
+            hosts: [{'url': ..., 'models': [...]}] (None = single default host)
+            keep_alive: How long hosts keep models loaded after a request (e.g. "30m")
+            health_interval: Seconds before an unhealthy host is retried
+        """
+        hosts = hosts or [{'url': None}]
+        self.backends = [OllamaBackend(h.get('url'), h.get('models')) for h in hosts]
+        self.keep_alive = keep_alive
+        self.health_interval = health_interval
+        self._lock = threading.Lock()
+        self._health_thread = None
+        self._health_stop = threading.Event()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> 'OllamaPool':
+        """Build a pool from the `backends` section of agents.yaml (may be None)"""
+        config = config or {}
+        return cls(
+            hosts=config.get('hosts'),
+            keep_alive=config.get('keep_alive'),
+            health_interval=config.get('health_interval', 30.0)
+        )
+
+    def candidates(self, model: str) -> List[OllamaBackend]:
+        """
+        Hosts to try for a model, best first: healthy before unhealthy,
+        then fewest outstanding requests, then model already resident.
+        """
+        serving = [b for b in self.backends if b.serves(model)] or list(self.backends)
+        return sorted(
+            serving,
+            key=lambda b: (not b.healthy, b.outstanding, model not in b.resident)
+        )
+
+    def _recheck_failed(self):
+        """
+        Give failed hosts another chance once health_interval has passed.
+        Only needed when the background health checks aren't running.
+        """
+        if self._health_thread is not None:
+            return
+        now = time.monotonic()
+        for backend in self.backends:
+            if not backend.healthy and now - backend.last_check > self.health_interval:
+                backend.check()
+
+    def _acquire(self, model: str) -> Iterator[OllamaBackend]:
+        """
+        Yield hosts to try in turn, each with its request already counted.
+        Picking and counting happen under one lock, so concurrent callers
+        spread over the hosts instead of all picking the same idle one.
+        """
+        tried = set()
+        while True:
+            with self._lock:
+                left = [b for b in self.candidates(model) if b not in tried]
+                if not left:
+                    return
+                backend = left[0]
+                backend.outstanding += 1
+            tried.add(backend)
+            yield backend
+
+    def _finish(self, backend: OllamaBackend, model: str, ok: bool, error: Exception = None):
+        with self._lock:
+            backend.outstanding -= 1
+            if ok:
+                backend.healthy = True
+                backend.resident.add(model)
+            elif error is not None and not isinstance(error, ollama.ResponseError):
+                backend.healthy = False
+                backend.last_check = time.monotonic()
+                backend.last_error = str(error)
+
+    def chat(self, model: str, messages: List[Dict], options: Optional[Dict] = None,
+             stream: bool = False):
+        """ollama.chat on the best available host, failing over on errors"""
+        if stream:
+            return self._chat_stream(model, messages, options)
+
+        self._recheck_failed()
+        last_error = None
+        for backend in self._acquire(model):
+            try:
+                response = backend.client.chat(model=model, messages=messages, options=options,
+                                               keep_alive=self.keep_alive)
+            except Exception as e:
+                self._finish(backend, model, False, e)
+                if not _is_failover_error(e):
+                    raise
+                print(f"Warning: Ollama host {backend.name} failed for {model}: {e}")
+                last_error = e
+                continue
+            self._finish(backend, model, True)
+            return response
+        raise last_error
+
+    def _chat_stream(self, model: str, messages: List[Dict], options: Optional[Dict]) -> Iterator:
+        """Streaming chat; fails over only until the first chunk arrives"""
+        self._recheck_failed()
+        last_error = None
+        for backend in self._acquire(model):
+            started, ok, error = False, False, None
+            try:
+                for chunk in backend.client.chat(model=model, messages=messages, options=options,
+                                                 keep_alive=self.keep_alive, stream=True):
+                    started = True
+                    yield chunk
+                ok = True
+                return
+            except Exception as e:
+                error = e
+                if started or not _is_failover_error(e):
+                    raise
+                print(f"Warning: Ollama host {backend.name} failed for {model}: {e}")
+                last_error = e
+            finally:
+                # Also runs if the caller stops iterating early
+                self._finish(backend, model, ok, error)
+        raise last_error
+
+    async def achat(self, model: str, messages: List[Dict], options: Optional[Dict] = None):
+        """Async ollama chat on the best available host, failing over on errors"""
+        # Health checks are blocking HTTP calls - keep them off the event loop
+        await asyncio.to_thread(self._recheck_failed)
+
+        last_error = None
+        for backend in self._acquire(model):
+            try:
+                client = await backend.async_client()
+                response = await client.chat(
+                    model=model, messages=messages, options=options, keep_alive=self.keep_alive)
+            except Exception as e:
+                self._finish(backend, model, False, e)
+                if not _is_failover_error(e):
+                    raise
+                print(f"Warning: Ollama host {backend.name} failed for {model}: {e}")
+                last_error = e
+                continue
+            self._finish(backend, model, True)
+            return response
+        raise last_error
+
+    def check_health(self) -> Dict[str, bool]:
+        """Check every host now. Returns {host: healthy}."""
+        return {backend.name: backend.check() for backend in self.backends}
+
+    def start_health_checks(self):
+        """
+        Re-check every host every health_interval seconds in a daemon
+        thread: failed hosts come back, and `resident` follows what each
+        host actually has loaded (models get unloaded after keep_alive).
+        """
+        if self._health_thread is not None:
+            return
+
+        stop = self._health_stop = threading.Event()
+
+        def loop():
+            while True:
+                self.check_health()
+                if stop.wait(self.health_interval):
+                    return
+
+        self._health_thread = threading.Thread(target=loop, name='ollama-health', daemon=True)
+        self._health_thread.start()
+
+    def stop_health_checks(self):
+        """Stop the background health checks (e.g. when the pool is replaced)"""
+        self._health_stop.set()
+        self._health_thread = None
+
+    def warm_up(self, models: List[str]):
+        """
+        Load each model on every host that serves it (an empty generate
+        request), pinned with keep_alive, so the first real query doesn't
+        pay load_duration.
+        """
+        for model in sorted(set(models)):
+            for backend in self.backends:
+                if not backend.serves(model):
+                    continue
+                try:
+                    backend.client.generate(model=model, prompt='', keep_alive=self.keep_alive)
+                    backend.resident.add(model)
+                    print(f"Warmed up {model} on {backend.name}")
+                except Exception as e:
+                    if _is_failover_error(e) and not isinstance(e, ollama.ResponseError):
+                        backend.healthy = False
+                        backend.last_check = time.monotonic()
+                        backend.last_error = str(e)
+                    print(f"Warning: could not warm up {model} on {backend.name}: {e}")
+
+    def stats(self) -> List[Dict]:
+        """Per-host load and health"""
+        return [{
+            'host': b.name,
+            'healthy': b.healthy,
+            'outstanding': b.outstanding,
+            'resident': sorted(b.resident),
+            'last_error': b.last_error
+        } for b in self.backends]
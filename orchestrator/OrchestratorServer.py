@@ -0,0 +1,505 @@
+# agents/orchestrator/OrchestratorServer.py
+import heapq
+import http.client
+import itertools
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+# Lower runs first
+PRIORITIES = {'interactive': 0, 'normal': 5, 'background': 10}
+
+
+def parse_priority(value) -> int:
+    """Priority name ('interactive', 'normal', 'background') or int. Raises ValueError."""
+    if value is None:
+        return PRIORITIES['normal']
+    if isinstance(value, str):
+        if value in PRIORITIES:
+            return PRIORITIES[value]
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    elif isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"unknown priority {value!r} (use {', '.join(PRIORITIES)} or an integer)")
+
+
+def parse_wait(value) -> Tuple[bool, Optional[float]]:
+    """
+    A request's `wait`: false/absent = don't wait, true = wait until done,
+    a number = wait at most that many seconds (so 1 is one second, not
+    true). Raises ValueError.
+
+    Returns: (wait, timeout)
+    """
+    if value is None or value is False or value == 'false':
+        return False, None
+    if value is True or value == 'true':
+        return True, None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"invalid wait {value!r} (use true, false or a number of seconds)")
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise ValueError(f"invalid wait {value!r} (use true, false or a number of seconds)")
+    if not 0 <= seconds <= threading.TIMEOUT_MAX:
+        raise ValueError(f"invalid wait {value!r} (seconds must be between 0 and {threading.TIMEOUT_MAX:g})")
+    if seconds == 0:
+        return False, None
+    return True, seconds
+
+
+class Job:
+    """One queued query and, once run, its result"""
+
+    def __init__(self, query: str, priority: int, selection: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.query = query
+        self.priority = priority
+        self.selection = selection  # agent name or 'workflow:<skill>' (see select_agent)
+        self.status = 'queued'
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self._done = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict:
+        job = {
+            'id': self.id,
+            'query': self.query,
+            'priority': self.priority,
+            'selection': self.selection,
+            'status': self.status,
+            'submitted': self.submitted,
+        }
+        if self.started is not None:
+            job['queue_seconds'] = round(self.started - self.submitted, 3)
+        if self.finished is not None:
+            job['run_seconds'] = round(self.finished - self.started, 3)
+            job['result'] = self.result
+            if self.error:
+                job['error'] = self.error
+        return job
+
+
+class JobQueue:
+    """
+    Priority queue with per-target concurrency limits.
+
+    get() hands out the highest-priority job (FIFO within a priority)
+    whose agent/workflow has a free slot, so a backlog for one agent
+    doesn't hold up queries routed to another.
+    """
+
+    def __init__(self, limit_for: Callable[[str], int]):
+        """
+        Args:
+            limit_for: selection -> max jobs running at once for it
+        """
+        self.limit_for = limit_for
+        self._pending = []  # heap of (priority, seq, job)
+        self._seq = itertools.count()
+        self._running = Counter()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, job: Job):
+        with self._cond:
+            heapq.heappush(self._pending, (job.priority, next(self._seq), job))
+            self._cond.notify_all()
+
+    def get(self) -> Optional[Job]:
+        """Block until a runnable job is available. Returns None once closed."""
+        with self._cond:
+            while not self._closed:
+                for entry in sorted(self._pending):
+                    job = entry[2]
+                    if self._running[job.selection] < max(1, self.limit_for(job.selection)):
+                        self._pending.remove(entry)
+                        heapq.heapify(self._pending)
+                        self._running[job.selection] += 1
+                        return job
+                self._cond.wait()
+            return None
+
+    def done(self, job: Job):
+        with self._cond:
+            self._running[job.selection] -= 1
+            if self._running[job.selection] <= 0:
+                del self._running[job.selection]
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return {
+                'queued': len(self._pending),
+                'running': dict(self._running),
+            }
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class OrchestratorServer:
+    """
+    Long-running process around one AgentOrchestrator.
+
+    Keeps the orchestrator (parsed config, skill registry, caches, Ollama
+    clients, tools) in memory and serves queries over a local HTTP or
+    Unix-socket API:
+
+        POST /jobs          {"query": ..., "priority": "interactive", "wait": true}
+        GET  /jobs/<id>     ?wait=<seconds> blocks until the job finishes
+        GET  /stats         queue, Ollama hosts, caches
+        POST /reload        pick up agents.yaml / SKILL.md changes now
+        GET  /health
+
+    Jobs run on `workers` threads in priority order. Each agent runs at
+    most `workers: N` jobs at once (agents.yaml, default `agent_workers`),
+    so a scheduled daily summary at background priority doesn't block
+    interactive queries to other agents. Tool workflows run one at a time
+    unless `workflow_workers` says otherwise.
+    """
+
+    def __init__(self, orchestrator, host: str = '127.0.0.1', port: int = 8765,
+                 socket_path: Optional[str] = None, workers: int = 4,
+                 agent_workers: int = 1, workflow_workers: int = 1,
+                 reload_interval: float = 2.0, max_finished: int = 1000):
+        """
+        Args:
+            orchestrator: AgentOrchestrator to serve
+            host, port: HTTP address (ignored when socket_path is set)
+            socket_path: Serve on this Unix socket instead of TCP
+            workers: Worker threads (max jobs running at once overall)
+            agent_workers: Default per-agent concurrency
+            workflow_workers: Per-workflow concurrency for tool workflows
+            reload_interval: Seconds between config/skill change checks (0 = off)
+            max_finished: Finished jobs kept for GET /jobs/<id>
+        """
+        self.orchestrator = orchestrator
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.workers = workers
+        self.agent_workers = agent_workers
+        self.workflow_workers = workflow_workers
+        self.reload_interval = reload_interval
+        self.max_finished = max_finished
+
+        self.queue = JobQueue(self._limit_for)
+        self._jobs = OrderedDict()  # id -> Job (queued, running and recent)
+        self._jobs_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._httpd = None
+        self.completed = 0
+        self.failed = 0
+
+    def _limit_for(self, selection: str) -> int:
+        if selection.startswith('workflow:'):
+            return self.workflow_workers
+        # Read on every dispatch so edits to agents.yaml apply without a restart
+        return self.orchestrator.agents.get(selection, {}).get('workers', self.agent_workers)
+
+    # ------------------------------------------------------------------
+    # Jobs
+
+    def submit(self, query: str, priority=None) -> Job:
+        """Route a query and queue it. Returns immediately."""
+        job = Job(query, parse_priority(priority), self.orchestrator.select_agent(query))
+        with self._jobs_lock:
+            self._jobs[job.id] = job
+        self.queue.put(job)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self._jobs_lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job):
+        job.status = 'running'
+        job.started = time.time()
+        try:
+            job.result = self.orchestrator.orchestrate(job.query, selection=job.selection)
+            job.status = 'done'
+            self.completed += 1
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.result = f"Error: {e}"
+            job.status = 'failed'
+            self.failed += 1
+            print(f"Warning: job {job.id} failed: {job.error}")
+        finally:
+            job.finished = time.time()
+            self.queue.done(job)
+            job._done.set()
+            self._forget_finished()
+
+    def _forget_finished(self):
+        with self._jobs_lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished is not None]
+            for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+                del self._jobs[job_id]
+
+    def _worker(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            self._run(job)
+
+    def schedule(self, query: str, interval: float, priority='background',
+                 first_delay: float = 0.0):
+        """
+        Submit `query` every `interval` seconds (e.g. the daily summary),
+        starting after `first_delay`. Runs until the server stops.
+        """
+        def loop():
+            if self._stop.wait(first_delay):
+                return
+            while True:
+                print(f"Scheduled job: {query}")
+                self.submit(query, priority)
+                if self._stop.wait(interval):
+                    return
+
+        self._spawn(loop, 'orchestrator-schedule')
+
+    def reload(self):
+        """Pick up agents.yaml / SKILL.md changes now"""
+        self.orchestrator.refresh()
+
+    def _reload_loop(self):
+        while not self._stop.wait(self.reload_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"Warning: reload failed: {e}")
+
+    def stats(self) -> Dict:
+        orchestrator = self.orchestrator
+        stats = {
+            'queue': self.queue.stats(),
+            'completed': self.completed,
+            'failed': self.failed,
+            'ollama': orchestrator.pool.stats(),
+            'skills': orchestrator.skill_registry.stats(),
+            'context': orchestrator.context_stats,
+            'tools_loaded': sorted(orchestrator.tools),
+        }
+        if orchestrator.response_cache is not None:
+            stats['response_cache'] = orchestrator.response_cache.stats()
+        return stats
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+
+    def _spawn(self, target, name: str):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _make_httpd(self):
+        handler = _make_handler(self)
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)  # stale socket from a previous run
+            return _UnixHTTPServer(self.socket_path, handler)
+        httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        httpd.daemon_threads = True
+        self.port = httpd.server_address[1]
+        return httpd
+
+    @property
+    def address(self) -> str:
+        return f"unix:{self.socket_path}" if self.socket_path else f"http://{self.host}:{self.port}"
+
+    def start(self) -> 'OrchestratorServer':
+        """Start workers, the reload watcher and the API in background threads"""
+        for n in range(self.workers):
+            self._spawn(self._worker, f"orchestrator-worker-{n}")
+        if self.reload_interval:
+            self._spawn(self._reload_loop, 'orchestrator-reload')
+        self._httpd = self._make_httpd()
+        self._spawn(self._httpd.serve_forever, 'orchestrator-api')
+        print(f"Orchestrator server listening on {self.address}")
+        return self
+
+    def serve_forever(self):
+        """start() and block until interrupted"""
+        self.start()
+        try:
+            while not self._stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            print("Shutting down")
+        finally:
+            self.stop()
+
+    def stop(self):
+        self._stop.set()
+        self.queue.close()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def _make_handler(server: OrchestratorServer):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send_json(self, payload, status: int = 200):
+            body = json.dumps(payload, default=str).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_json(self) -> Dict:
+            length = int(self.headers.get('Content-Length', 0))
+            return json.loads(self.rfile.read(length) or b'{}')
+
+        def _job_response(self, job: Job, wait: Tuple[bool, Optional[float]]):
+            should_wait, timeout = wait
+            if should_wait:
+                job.wait(timeout)
+            self._send_json(job.to_dict(), 200 if job.finished is not None else 202)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path == '/health':
+                self._send_json({'status': 'ok'})
+            elif url.path == '/stats':
+                self._send_json(server.stats())
+            elif url.path.startswith('/jobs/'):
+                job = server.get_job(url.path[len('/jobs/'):])
+                if job is None:
+                    self._send_json({'error': 'unknown job'}, 404)
+                    return
+                try:
+                    wait = parse_wait(query.get('wait', [None])[0])
+                except ValueError as e:
+                    self._send_json({'error': str(e)}, 400)
+                    return
+                self._job_response(job, wait)
+            else:
+                self._send_json({'error': 'not found'}, 404)
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            try:
+                request = self._read_json()
+            except ValueError as e:
+                self._send_json({'error': f"invalid JSON: {e}"}, 400)
+                return
+            if not isinstance(request, dict):
+                self._send_json({'error': 'request body must be a JSON object'}, 400)
+                return
+
+            if url.path == '/jobs':
+                query = request.get('query')
+                if not query or not isinstance(query, str):
+                    self._send_json({'error': "missing 'query' (a string)"}, 400)
+                    return
+                # Validate everything before queueing, so a bad request never leaves a job behind
+                try:
+                    priority = parse_priority(request.get('priority'))
+                    wait = parse_wait(request.get('wait'))
+                except ValueError as e:
+                    self._send_json({'error': str(e)}, 400)
+                    return
+                job = server.submit(query, priority)
+                self._job_response(job, wait)
+            elif url.path == '/reload':
+                server.reload()
+                self._send_json({'status': 'reloaded', 'agents': sorted(server.orchestrator.agents)})
+            else:
+                self._send_json({'error': 'not found'}, 404)
+
+    return Handler
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class OrchestratorClient:
+    """
+    Minimal client for OrchestratorServer (standard library only, so
+    asking a question doesn't import ollama, yaml or any tools).
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765,
+                 socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, payload: Optional[Dict] = None) -> Dict:
+        if self.socket_path:
+            conn = _UnixHTTPConnection(self.socket_path, self.timeout)
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            body = json.dumps(payload).encode() if payload is not None else None
+            headers = {'Content-Type': 'application/json'} if body else {}
+            conn.request(method, path, body=body, headers=headers)
+            return json.loads(conn.getresponse().read() or b'{}')
+        finally:
+            conn.close()
+
+    def submit(self, query: str, priority='interactive', wait=True) -> Dict:
+        """Queue a query; with wait=True block until it finishes"""
+        return self._request('POST', '/jobs', {'query': query, 'priority': priority, 'wait': wait})
+
+    def ask(self, query: str, priority='interactive') -> str:
+        """Run a query and return its result text"""
+        return self.submit(query, priority, wait=True).get('result', '')
+
+    def job(self, job_id: str, wait: Union[bool, float, None] = None) -> Dict:
+        """Job status; wait=True blocks until it finishes, a number waits that many seconds"""
+        if wait is True:
+            wait = 'true'
+        path = f"/jobs/{job_id}" + (f"?wait={wait}" if wait not in (None, False) else '')
+        return self._request('GET', path)
+
+    def stats(self) -> Dict:
+        return self._request('GET', '/stats')
+
+    def reload(self) -> Dict:
+        return self._request('POST', '/reload')
@@ -0,0 +1,409 @@
+# agents/orchestrator/PageFetcher.py
+import codecs
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urldefrag, urlsplit
+
+import httpx
+
+from orchestrator.ContextBudget import best_passages
+from orchestrator.SearchCache import SearchBackend
+
+# Never contain article text
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg', 'canvas', 'iframe',
+             'nav', 'header', 'footer', 'aside', 'form', 'button', 'select'}
+# Tags that end a paragraph of text
+BLOCK_TAGS = {'p', 'div', 'section', 'article', 'main', 'li', 'ul', 'ol', 'table', 'tr', 'td', 'th',
+              'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre', 'br', 'hr',
+              'dd', 'dt', 'figcaption', 'body'}
+MAIN_TAGS = {'article', 'main'}
+HTML_TYPES = ('text/html', 'application/xhtml+xml')
+
+
+class TextExtractor(HTMLParser):
+    """
+    Incremental main-text extractor. feed() it HTML chunks as they arrive;
+    only the extracted paragraphs are kept, never the page itself.
+
+    Text inside script/style/nav/header/footer/aside/forms is dropped.
+    A paragraph is kept if it has at least `min_words` words and isn't
+    mostly link text (menus, tag clouds). If the page has <article> or
+    <main>, only paragraphs inside it are returned.
+    """
+
+    def __init__(self, min_words: int = 8, max_chars: int = 50000):
+        """
+        Args:
+            min_words: Shorter text blocks are treated as boilerplate
+            max_chars: Stop collecting once this much text is kept (see `full`)
+        """
+        super().__init__(convert_charrefs=True)
+        self.min_words = min_words
+        self.max_chars = max_chars
+        self.title = ''
+        self._paragraphs = []  # (inside article/main, text)
+        self._chars = 0
+        self._buffer = []
+        self._link_chars = 0
+        self._skip_depth = 0
+        self._main_depth = 0
+        self._link_depth = 0
+        self._in_title = False
+
+    @property
+    def full(self) -> bool:
+        """True once max_chars of text is collected - the caller can stop reading"""
+        return self._chars >= self.max_chars
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'title':
+            self._in_title = True
+        elif tag == 'a':
+            self._link_depth += 1
+        if tag in BLOCK_TAGS:
+            self._flush()
+        if tag in MAIN_TAGS:
+            self._main_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'title':
+            self._in_title = False
+        elif tag == 'a':
+            self._link_depth = max(0, self._link_depth - 1)
+        if tag in BLOCK_TAGS:
+            self._flush()
+        if tag in MAIN_TAGS:
+            self._main_depth = max(0, self._main_depth - 1)
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title = ' '.join((self.title + data).split())
+        elif not self._skip_depth and not self.full:
+            self._buffer.append(data)
+            if self._link_depth:
+                self._link_chars += len(data.strip())
+
+    def _flush(self):
+        text = ' '.join(''.join(self._buffer).split())
+        link_chars = self._link_chars
+        self._buffer = []
+        self._link_chars = 0
+        if len(text.split()) < self.min_words or link_chars > len(text) / 2:
+            return
+        self._paragraphs.append((self._main_depth > 0, text))
+        self._chars += len(text)
+
+    def paragraphs(self) -> List[str]:
+        """Extracted paragraphs in page order"""
+        self._flush()
+        main = [text for in_main, text in self._paragraphs if in_main]
+        return main or [text for _, text in self._paragraphs]
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a URL (the #fragment never changes the page)"""
+    return urldefrag(url.strip())[0]
+
+
+class PageFetcher:
+    """
+    Fetch stage for web research: downloads search-result pages
+    concurrently and extracts their main text.
+
+    - One pooled httpx.Client (keep-alive connections are reused across
+      pages and calls) and a thread pool of `concurrency` downloads, with
+      at most `per_host` at once per host
+    - Per-request timeout, overall per-page deadline and a `max_bytes`
+      cap; HTML is streamed into TextExtractor chunk by chunk, so a page
+      is never held in memory whole
+    - Extracted text is cached in SQLite by URL. Fresh entries (< ttl)
+      are served without a request; stale ones are revalidated with
+      If-None-Match / If-Modified-Since, and a 304 reuses the cached text
+
+    Usage (main.py), after the search cache:
+        page_fetcher = PageFetcher(".cache/page_cache.sqlite")
+        ddg_search_tool.search_duckduckgo = page_fetcher.wrap(ddg_search_tool.search_duckduckgo)
+
+    Wrapped searches return results whose snippet is followed by the
+    page's most relevant passages, so format_results_for_llm passes them
+    to the LLM unchanged.
+    """
+
+    def __init__(self, cache_path: str = ".cache/page_cache.sqlite",
+                 ttl: float = 24 * 3600,
+                 max_entries: int = 2000,
+                 concurrency: int = 8,
+                 per_host: int = 2,
+                 timeout: float = 10.0,
+                 max_bytes: int = 2_000_000,
+                 max_chars: int = 50000,
+                 passage_chars: int = 1500,
+                 max_pages: int = 5,
+                 user_agent: str = "Mozilla/5.0 (compatible; agent-orchestrator)"):
+        """
+        Args:
+            cache_path: SQLite file (":memory:" for a process-local cache)
+            ttl: Seconds cached text is used without revalidating
+            max_entries: Max cached pages before LRU eviction
+            concurrency: Max downloads in flight
+            per_host: Max downloads in flight per host
+            timeout: Seconds for connect/each read, and for a whole page
+            max_bytes: Stop reading a page after this many bytes
+            max_chars: Stop reading once this much text is extracted
+            passage_chars: Characters of best passages added per result
+            max_pages: Results fetched per search (top-ranked first)
+            user_agent: User-Agent header sent with every request
+        """
+        if cache_path != ":memory:":
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.passage_chars = passage_chars
+        self.max_pages = max_pages
+
+        self.client = httpx.Client(
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            follow_redirects=True,
+            headers={'User-Agent': user_agent, 'Accept': 'text/html,application/xhtml+xml,text/plain'}
+        )
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='page-fetch')
+        self._host_limits = {}
+        self._host_lock = threading.Lock()
+
+        self._db = sqlite3.connect(cache_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY,"
+            " title TEXT,"
+            " paragraphs TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " fetched_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+        self.errors = 0
+        self.partial = 0
+        self.bytes_read = 0
+
+    # ------------------------------------------------------------------
+    # Cache
+
+    def _cache_get(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT title, paragraphs, etag, last_modified, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self._db.commit()
+        return {'title': row[0], 'paragraphs': json.loads(row[1]), 'etag': row[2],
+                'last_modified': row[3], 'fetched_at': row[4]}
+
+    def _cache_put(self, url: str, page: Dict, etag: Optional[str], last_modified: Optional[str]):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, page['title'], json.dumps(page['paragraphs']), etag, last_modified, now, now)
+            )
+            count = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM pages WHERE url IN ("
+                    " SELECT url FROM pages ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            self._db.commit()
+
+    def _count(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def _cache_touch(self, url: str):
+        with self._lock:
+            self._db.execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._db.commit()
+
+    def clear(self):
+        """Remove every cached page"""
+        with self._lock:
+            self._db.execute("DELETE FROM pages")
+            self._db.commit()
+
+    # ------------------------------------------------------------------
+    # Fetching
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._host_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _download(self, url: str, cached: Optional[Dict]) -> Dict:
+        """GET (conditional if cached) and stream the body into the extractor"""
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        with self._host_limit(url):
+            # Time spent queued behind per_host doesn't count against the page
+            deadline = time.monotonic() + self.timeout
+            timed_out = False
+            with self.client.stream('GET', url, headers=headers) as response:
+                if response.status_code == 304 and cached:
+                    self._cache_touch(url)
+                    self._count(revalidated=1)
+                    return {'url': url, 'title': cached['title'], 'paragraphs': cached['paragraphs'],
+                            'cached': True}
+                response.raise_for_status()
+
+                content_type = response.headers.get('content-type', 'text/html').split(';')[0].strip().lower()
+                if content_type not in HTML_TYPES and content_type != 'text/plain':
+                    raise ValueError(f"unsupported content type {content_type}")
+
+                decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+                extractor = TextExtractor(max_chars=self.max_chars)
+                plain = []
+                size = 0
+                for chunk in response.iter_bytes():
+                    size += len(chunk)
+                    text = decoder.decode(chunk)
+                    if content_type == 'text/plain':
+                        plain.append(text)
+                    else:
+                        extractor.feed(text)
+                    # Stop early: size cap or enough text (complete enough to cache) ...
+                    if size >= self.max_bytes or extractor.full:
+                        break
+                    # ... or too slow overall (partial - not cached)
+                    if time.monotonic() > deadline:
+                        timed_out = True
+                        break
+                self._count(downloads=1, bytes_read=size)
+
+        if content_type == 'text/plain':
+            paragraphs = [' '.join(p.split()) for p in ''.join(plain).split('\n\n') if p.strip()]
+            title = ''
+        else:
+            extractor.close()
+            paragraphs = extractor.paragraphs()
+            title = extractor.title
+
+        page = {'url': url, 'title': title, 'paragraphs': paragraphs, 'cached': False}
+        if timed_out:
+            # Use what arrived, but don't let a truncated page stand in for the full one
+            self._count(partial=1)
+            page['partial'] = True
+        else:
+            self._cache_put(url, page, response.headers.get('etag'), response.headers.get('last-modified'))
+        return page
+
+    def fetch(self, url: str) -> Dict:
+        """
+        Extracted text for one URL.
+
+        Returns: {'url', 'title', 'paragraphs', 'cached'} ('partial' is set
+        if the page hit the deadline; such pages aren't cached), or
+        {'url', 'error'} if the page couldn't be fetched.
+        """
+        url = normalize_url(url)
+        cached = self._cache_get(url)
+        if cached and time.time() - cached['fetched_at'] < self.ttl:
+            self._count(hits=1)
+            return {'url': url, 'title': cached['title'], 'paragraphs': cached['paragraphs'], 'cached': True}
+
+        try:
+            return self._download(url, cached)
+        except Exception as e:
+            self._count(errors=1)
+            if cached:
+                # Serve stale text rather than nothing
+                print(f"Warning: could not refresh {url}, using cached text: {e}")
+                return {'url': url, 'title': cached['title'], 'paragraphs': cached['paragraphs'],
+                        'cached': True}
+            return {'url': url, 'error': f"{type(e).__name__}: {e}"}
+
+    def fetch_many(self, urls: List[str]) -> List[Dict]:
+        """Fetch URLs concurrently; results are in input order"""
+        return list(self._executor.map(self.fetch, urls))
+
+    def enrich(self, query: str, results: List[Dict]) -> List[Dict]:
+        """
+        Add each page's most relevant passages to search results.
+
+        The top `max_pages` results are fetched; each gets 'content' (the
+        best passages) and the passages are appended to its 'snippet'.
+        Results whose page couldn't be fetched are returned unchanged.
+        """
+        if not results or 'error' in results[0]:
+            return results
+
+        targets = [r for r in results[:self.max_pages] if r.get('url')]
+        pages = {id(r): page for r, page in zip(targets, self.fetch_many([r['url'] for r in targets]))}
+
+        enriched = []
+        for result in results:
+            page = pages.get(id(result))
+            if not page or 'error' in page:
+                enriched.append(result)
+                continue
+            passages = best_passages(query, page['paragraphs'], self.passage_chars)
+            if passages:
+                snippet = result.get('snippet', '')
+                result = {**result, 'content': passages,
+                          'snippet': f"{snippet}\n\n{passages}" if snippet else passages}
+            enriched.append(result)
+        return enriched
+
+    def wrap(self, backend: SearchBackend) -> SearchBackend:
+        """Search function that runs `backend` then fetches the result pages"""
+        def search_and_fetch(query: str, max_results: int = 5) -> List[Dict]:
+            return self.enrich(query, backend(query, max_results))
+        return search_and_fetch
+
+    def stats(self) -> Dict:
+        """Cache hits, revalidations (304s), downloads, errors, partial pages and bytes read"""
+        with self._lock:
+            size = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'downloads': self.downloads,
+            'errors': self.errors,
+            'partial': self.partial,
+            'bytes_read': self.bytes_read,
+            'entries': size,
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.client.close()
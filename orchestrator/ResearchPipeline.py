@@ -0,0 +1,142 @@
+# agents/orchestrator/ResearchPipeline.py
+import asyncio
+from typing import List, Dict, Optional, Iterable, Union, Tuple
+
+from orchestrator.ContextBudget import fit_search_results
+
+
+def topic_key(topic: str) -> str:
+    """Normalize a tag topic so the same topic from different notes is researched once"""
+    return ' '.join(topic.casefold().replace('-', ' ').replace('_', ' ').split())
+
+
+class ResearchPipeline:
+    """
+    Pipelined research for #open-research tags.
+
+    Each unique topic goes through two stages:
+    1. Web search (search_tool.search_duckduckgo, run in a worker thread),
+       optionally followed by fetching the result pages (PageFetcher)
+    2. Synthesis by research_agent (orchestrator.ainvoke_agent)
+
+    Topics flow through independently, so synthesis for a topic starts as
+    soon as its own search returns instead of waiting for every search.
+    Each stage has its own concurrency bound - searches are cheap but
+    rate-limited, LLM calls are expensive.
+
+    Usage (e.g. from ObsidianTool.execute):
+        pipeline = ResearchPipeline(self.orchestrator, search_tool)
+        research = pipeline.run([(tag_topic, note_path), ...])
+    """
+
+    def __init__(self, orchestrator, search_tool=None,
+                 agent_name: str = 'research_agent',
+                 search_concurrency: int = 4,
+                 synthesis_concurrency: int = 2,
+                 max_results: int = 5,
+                 skills: Optional[List[Dict]] = None,
+                 search_budget_tokens: Optional[int] = None,
+                 page_fetcher=None):
+        """
+        Args:
+            orchestrator: AgentOrchestrator used for the synthesis stage
+            search_tool: Object with search_duckduckgo / format_results_for_llm
+                (e.g. DuckDuckGoSearchTool). If None, topics are synthesized
+                without search results.
+            agent_name: Agent that writes each topic summary
+            search_concurrency: Max searches in flight
+            synthesis_concurrency: Max LLM calls in flight
+            max_results: Search results per topic
+            skills: Optional skills for the agent (defaults to its agents.yaml skills)
+            search_budget_tokens: Token budget for each topic's search results
+                (default: half the agent's max_context_tokens, if set)
+            page_fetcher: Optional PageFetcher; adds the best passages of each
+                result page to its snippet before the results are budgeted
+        """
+        self.orchestrator = orchestrator
+        self.search_tool = search_tool
+        self.agent_name = agent_name
+        self.search_concurrency = search_concurrency
+        self.synthesis_concurrency = synthesis_concurrency
+        self.max_results = max_results
+        self.skills = skills
+        self.page_fetcher = page_fetcher
+
+        if search_budget_tokens is None:
+            max_tokens = orchestrator.agents.get(agent_name, {}).get('max_context_tokens')
+            search_budget_tokens = max_tokens // 2 if max_tokens else None
+        self.search_budget_tokens = search_budget_tokens
+
+    @staticmethod
+    def dedupe(topics: Iterable[Union[str, Tuple[str, str]]]) -> List[Dict]:
+        """
+        Collapse identical topics across notes.
+
+        Args:
+            topics: Topic strings, or (topic, source_note) pairs
+
+        Returns: [{'topic', 'sources'}] sorted by normalized topic, so the
+        output order doesn't depend on vault scan order.
+        """
+        merged = {}
+        for item in topics:
+            topic, source = (item, None) if isinstance(item, str) else item
+            key = topic_key(topic)
+            if not key:
+                continue
+            entry = merged.setdefault(key, {'topic': topic.strip(), 'sources': []})
+            if source and source not in entry['sources']:
+                entry['sources'].append(source)
+
+        return [merged[key] for key in sorted(merged)]
+
+    async def _search(self, topic: str) -> Tuple[List[Dict], str]:
+        """Stage 1: search and format results for the LLM"""
+        if self.search_tool is None:
+            return [], ''
+        results = await asyncio.to_thread(
+            self.search_tool.search_duckduckgo, topic, self.max_results)
+        if not results or 'error' in results[0]:
+            return results or [], ''
+        if self.page_fetcher is not None:
+            results = await asyncio.to_thread(self.page_fetcher.enrich, topic, results)
+        # Most relevant results first, trimmed to the agent's budget
+        results = fit_search_results(topic, results, self.search_budget_tokens)
+        return results, self.search_tool.format_results_for_llm(topic, results)
+
+    async def _research(self, entry: Dict, search_limit: asyncio.Semaphore,
+                        synthesis_limit: asyncio.Semaphore) -> Dict:
+        topic = entry['topic']
+        try:
+            async with search_limit:
+                results, context = await self._search(topic)
+
+            async with synthesis_limit:
+                summary = await self.orchestrator.ainvoke_agent(
+                    self.agent_name,
+                    f"Research this topic and summarize what you find: {topic}",
+                    skills=self.skills,
+                    context=context or None
+                )
+            return {**entry, 'results': results, 'summary': summary}
+        except Exception as e:
+            return {**entry, 'results': [], 'summary': None, 'error': str(e)}
+
+    async def arun(self, topics: Iterable[Union[str, Tuple[str, str]]]) -> List[Dict]:
+        """
+        Research every unique topic.
+
+        Returns: [{'topic', 'sources', 'results', 'summary'}] in sorted topic
+        order ('error' is set instead of 'summary' for topics that failed).
+        """
+        entries = self.dedupe(topics)
+        search_limit = asyncio.Semaphore(self.search_concurrency)
+        synthesis_limit = asyncio.Semaphore(self.synthesis_concurrency)
+
+        return await asyncio.gather(
+            *(self._research(entry, search_limit, synthesis_limit) for entry in entries)
+        )
+
+    def run(self, topics: Iterable[Union[str, Tuple[str, str]]]) -> List[Dict]:
+        """Sync wrapper around arun for tools with a sync execute()"""
+        return asyncio.run(self.arun(topics))
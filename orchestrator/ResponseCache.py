@@ -0,0 +1,120 @@
+# agents/orchestrator/ResponseCache.py
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def response_key(model: str, messages: List[Dict], options: Optional[Dict] = None) -> str:
+    """Content address for an LLM call: hash of model + full message list + generation options"""
+    payload = json.dumps(
+        {'model': model, 'messages': messages, 'options': options or {}},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Disk-backed, content-addressed cache of agent responses.
+
+    Identical (model, messages, options) calls return the stored response
+    instead of running inference again. Entries expire after a TTL and
+    the least recently used are evicted beyond `max_entries`. Each entry
+    remembers how long the original inference took, so hits can report
+    the inference time they saved.
+
+    Agents opt in from agents.yaml:
+        research_agent:
+          cache: true
+          cache_ttl: 86400     # optional, seconds
+    """
+
+    def __init__(self, path: str = ".cache/llm_responses.sqlite",
+                 ttl: float = 7 * 24 * 3600,
+                 max_entries: int = 2000):
+        """
+        Args:
+            path: SQLite file (":memory:" for a process-local cache)
+            ttl: Default seconds an entry stays valid
+            max_entries: Max cached responses before LRU eviction
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT,"
+            " content TEXT NOT NULL,"
+            " inference_seconds REAL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.seconds_saved = 0.0
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[str]:
+        """Cached response content, or None on a miss/expired entry"""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content, inference_seconds, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or time.time() - row[2] > ttl:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            self.hits += 1
+            self.seconds_saved += row[1] or 0.0
+            return row[0]
+
+    def put(self, key: str, content: str, model: str = '', inference_seconds: float = 0.0):
+        """Store a response and evict least-recently-used entries over max_entries"""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, content, inference_seconds, now, now)
+            )
+            count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+            self._db.commit()
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters, entries and inference seconds saved"""
+        with self._lock:
+            size = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': size,
+                'seconds_saved': round(self.seconds_saved, 3)
+            }
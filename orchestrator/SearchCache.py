@@ -0,0 +1,217 @@
+# agents/orchestrator/SearchCache.py
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# (query, max_results) -> results, e.g. DuckDuckGoSearchTool.search_duckduckgo
+SearchBackend = Callable[[str, int], List[Dict]]
+
+
+def normalize_query(query: str) -> str:
+    """Case/whitespace-insensitive cache key for a search query"""
+    return ' '.join(query.casefold().split())
+
+
+class TokenBucket:
+    """
+    Simple token-bucket rate limiter.
+    Allows bursts of up to `capacity` calls, refilling at `rate` tokens/sec.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SearchCache:
+    """
+    Disk-backed cache in front of a web search backend.
+
+    - Results are stored in SQLite keyed on (normalized query, max_results),
+      so they survive across main.py runs.
+    - Entries expire after `ttl` seconds; beyond `max_entries` the least
+      recently used entries are evicted.
+    - Concurrent identical lookups are coalesced into one backend call.
+    - Backend calls pass through a token-bucket rate limiter.
+    - offline=True never calls the backend (cache-only, stale entries allowed).
+
+    Usage (main.py):
+        search_cache = SearchCache(".cache/search_cache.sqlite")
+        ddg_search_tool.search_duckduckgo = search_cache.wrap(ddg_search_tool.search_duckduckgo)
+    """
+
+    def __init__(self, path: str = ".cache/search_cache.sqlite",
+                 ttl: float = 24 * 3600,
+                 max_entries: int = 5000,
+                 offline: bool = False,
+                 rate: float = 1.0,
+                 burst: int = 3):
+        """
+        Args:
+            path: SQLite file (":memory:" for a process-local cache)
+            ttl: Seconds a cached result stays fresh
+            max_entries: Max cached queries before LRU eviction
+            offline: Serve from cache only, never hit the backend
+            rate: Backend calls per second (token refill rate)
+            burst: Max backend calls in a burst
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.offline = offline
+        self.rate_limiter = TokenBucket(rate, burst)
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            " query TEXT NOT NULL,"
+            " max_results INTEGER NOT NULL,"
+            " results TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (query, max_results))"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+        self._in_flight = {}  # key -> Future shared by coalesced callers
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.backend_calls = 0
+        self.evictions = 0
+
+    def get(self, query: str, max_results: int, allow_stale: bool = False) -> Optional[List[Dict]]:
+        """Cached results for a query, or None on a miss"""
+        key = normalize_query(query)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT results, created_at FROM search_cache WHERE query = ? AND max_results = ?",
+                (key, max_results)
+            ).fetchone()
+            if row is None:
+                return None
+            if not allow_stale and time.time() - row[1] > self.ttl:
+                return None
+            self._db.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE query = ? AND max_results = ?",
+                (time.time(), key, max_results)
+            )
+            self._db.commit()
+            return json.loads(row[0])
+
+    def put(self, query: str, max_results: int, results: List[Dict]):
+        """Store results and evict least-recently-used entries over max_entries"""
+        key = normalize_query(query)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?)",
+                (key, max_results, json.dumps(results), now, now)
+            )
+            count = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                self._db.execute(
+                    "DELETE FROM search_cache WHERE rowid IN ("
+                    " SELECT rowid FROM search_cache ORDER BY accessed_at LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+            self._db.commit()
+
+    def search(self, query: str, max_results: int, backend: SearchBackend) -> List[Dict]:
+        """
+        Cached search. Falls through to `backend` on a miss (unless offline).
+        Error results (first result has an 'error' key) are never cached.
+        """
+        cached = self.get(query, max_results, allow_stale=self.offline)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        if self.offline:
+            self.misses += 1
+            return [{'error': f"Offline mode: no cached results for '{query}'"}]
+
+        key = (normalize_query(query), max_results)
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            # Another caller may have filled the cache between our lookup and now
+            results = self.get(query, max_results)
+            if results is not None:
+                future.set_result(results)
+                return results
+
+            self.rate_limiter.acquire()
+            self.backend_calls += 1
+            results = backend(query, max_results)
+            if results and 'error' not in results[0]:
+                self.put(query, max_results, results)
+            future.set_result(results)
+            return results
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def wrap(self, backend: SearchBackend) -> SearchBackend:
+        """Return a cached drop-in replacement for backend(query, max_results)"""
+        def cached_search(query: str, max_results: int = 5) -> List[Dict]:
+            return self.search(query, max_results, backend)
+        return cached_search
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            self._db.execute("DELETE FROM search_cache")
+            self._db.commit()
+
+    def stats(self) -> Dict:
+        """Hit/miss/coalescing counters and current size"""
+        with self._lock:
+            size = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'backend_calls': self.backend_calls,
+            'evictions': self.evictions,
+            'entries': size
+        }
@@ -0,0 +1,137 @@
+# agents/orchestrator/SkillRegistry.py
+import re
+import threading
+from typing import List, Dict, Optional, Tuple
+from pathlib import Path
+
+import yaml
+
+FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+
+
+def parse_skill_metadata(content: str) -> Dict:
+    """Extract YAML frontmatter from SKILL.md"""
+    match = FRONTMATTER_RE.match(content)
+    if match:
+        return yaml.safe_load(match.group(1)) or {}
+    return {}
+
+
+class SkillRegistry:
+    """
+    In-memory cache of parsed SKILL.md files.
+
+    Each skill is read and YAML-parsed once. On every lookup the file is
+    stat()ed and only re-parsed when its mtime or size changed, so routing
+    and prompt building don't pay for disk reads and yaml.safe_load on
+    every query. File watchers can call invalidate() to force a reload.
+    """
+
+    def __init__(self, skills_dir: str):
+        """
+        Args:
+            skills_dir: Path to skills directory (skills_dir/skill-name/SKILL.md)
+        """
+        self.skills_dir = Path(skills_dir)
+        self._skills = {}       # skill name -> (mtime_ns, size, skill dict)
+        self._names = None      # cached directory listing
+        self._names_mtime = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _skill_path(self, skill_name: str) -> Path:
+        return self.skills_dir / skill_name / "SKILL.md"
+
+    def get(self, skill_name: str) -> Optional[Dict]:
+        """
+        Return the {name, content, metadata} dict for a skill.
+        Returns None if the skill's SKILL.md doesn't exist.
+        """
+        skill_path = self._skill_path(skill_name)
+        try:
+            st = skill_path.stat()
+        except OSError:
+            with self._lock:
+                self._skills.pop(skill_name, None)
+            print(f"Warning: Skill '{skill_name}' not found at {skill_path}")
+            return None
+
+        with self._lock:
+            cached = self._skills.get(skill_name)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self.hits += 1
+                return cached[2]
+
+            self.misses += 1
+            with open(skill_path, 'r') as f:
+                content = f.read()
+            skill = {
+                'name': skill_name,
+                'content': content,
+                'metadata': parse_skill_metadata(content)
+            }
+            self._skills[skill_name] = (st.st_mtime_ns, st.st_size, skill)
+            return skill
+
+    def names(self) -> List[str]:
+        """
+        Names of all skill directories in skills_dir.
+        The listing is cached until the directory's mtime changes.
+        """
+        try:
+            mtime = self.skills_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            if self._names is None or self._names_mtime != mtime:
+                self._names = sorted(p.name for p in self.skills_dir.iterdir() if p.is_dir())
+                self._names_mtime = mtime
+            return list(self._names)
+
+    def all(self) -> List[Dict]:
+        """Load every skill in skills_dir (cached)."""
+        skills = []
+        for name in self.names():
+            if self._skill_path(name).exists():
+                skill = self.get(name)
+                if skill:
+                    skills.append(skill)
+        return skills
+
+    def signature(self) -> Tuple:
+        """
+        Cheap fingerprint of the skills on disk: (name, mtime, size) per skill.
+        Callers that derive state from skills (e.g. routing indexes) can compare
+        this to decide whether to rebuild.
+        """
+        sig = []
+        for name in self.names():
+            try:
+                st = self._skill_path(name).stat()
+            except OSError:
+                continue
+            sig.append((name, st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+
+    def invalidate(self, skill_name: Optional[str] = None):
+        """
+        Drop cached state so the next lookup re-reads from disk.
+        Call with no argument to clear everything (e.g. from a file watcher).
+        """
+        with self._lock:
+            if skill_name is None:
+                self._skills.clear()
+                self._names = None
+            else:
+                self._skills.pop(skill_name, None)
+
+    def stats(self) -> Dict:
+        """Cache hit/miss counters."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'cached': len(self._skills)
+            }
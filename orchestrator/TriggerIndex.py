@@ -0,0 +1,158 @@
+# agents/orchestrator/TriggerIndex.py
+from collections import deque
+from typing import List, Dict, Optional, Tuple
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so multi-word triggers match reliably"""
+    return ' '.join(text.lower().split())
+
+
+class TriggerIndex:
+    """
+    Precompiled routing index over agent and skill triggers.
+
+    All triggers are compiled into a single Aho-Corasick automaton, so a
+    query is routed in one pass regardless of how many agents/skills exist.
+
+    Matching rules:
+    - Case-insensitive, whitespace-normalized
+    - Triggers must start and end on a word boundary ("format" does not
+      match "information"). A trailing '*' makes the trigger a prefix
+      match, e.g. "document*" matches "documents".
+    - Highest `priority` wins (default 0). Ties go to agent triggers
+      before skill triggers, then to config/skill order - the same order
+      the old linear scan used.
+
+    Routes are the strings orchestrate() expects: an agent name, or
+    "workflow:<skill>" for skills with `requires_tool`.
+    """
+
+    def __init__(self):
+        self._agents = {}
+        self._agent_routes = []   # [(agent_name, triggers, priority)]
+        self._skill_routes = {}   # skill name -> (target, triggers, priority, source)
+        self._compiled = None
+
+    def set_agents(self, agents: Dict):
+        """(Re)index agent triggers and the skill -> agent mapping from agents.yaml"""
+        self._agents = agents
+        self._agent_routes = [
+            (name, config.get('triggers', []) or [], config.get('priority', 0))
+            for name, config in agents.items()
+        ]
+        # Plain skills route to the agent that owns them, so they depend on agents.yaml too
+        for name, (target, triggers, priority, source) in list(self._skill_routes.items()):
+            if source == 'skill':
+                self._skill_routes[name] = (self._owner(name), triggers, priority, source)
+        self._compiled = None
+
+    def set_skill(self, skill: Dict):
+        """(Re)index a single skill's triggers"""
+        metadata = skill['metadata'] or {}
+        triggers = metadata.get('triggers', []) or []
+        priority = metadata.get('priority', 0)
+
+        if metadata.get('requires_tool'):
+            route = (f"workflow:{skill['name']}", triggers, priority, 'workflow')
+        else:
+            route = (self._owner(skill['name']), triggers, priority, 'skill')
+
+        self._skill_routes[skill['name']] = route
+        self._compiled = None
+
+    def remove_skill(self, skill_name: str):
+        """Drop a skill's triggers from the index"""
+        if self._skill_routes.pop(skill_name, None) is not None:
+            self._compiled = None
+
+    def skill_names(self) -> List[str]:
+        return list(self._skill_routes)
+
+    def _owner(self, skill_name: str) -> Optional[str]:
+        """First agent in agents.yaml that lists this skill"""
+        for agent_name, config in self._agents.items():
+            if skill_name in config.get('skills', []):
+                return agent_name
+        return None
+
+    def _compile(self):
+        """Build the Aho-Corasick automaton from the current routes"""
+        goto = [{}]      # state -> {char: next state}
+        fail = [0]
+        output = [[]]    # state -> [(pattern length, prefix_match, rank, target, source)]
+
+        entries = [(target, triggers, priority, 'agent')
+                   for target, triggers, priority in self._agent_routes]
+        entries += [self._skill_routes[name] for name in sorted(self._skill_routes)]
+
+        for order, (target, triggers, priority, source) in enumerate(entries):
+            if target is None:
+                # Skill not assigned to any agent - the linear scan skipped these too
+                continue
+            rank = (-priority, order)
+            for trigger in triggers:
+                pattern = normalize(str(trigger))
+                prefix_match = pattern.endswith('*')
+                pattern = pattern.rstrip('*').rstrip()
+                if not pattern:
+                    continue
+
+                state = 0
+                for ch in pattern:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        fail.append(0)
+                        output.append([])
+                    state = nxt
+                output[state].append((len(pattern), prefix_match, rank, target, source))
+
+        # Breadth-first pass to compute failure links
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt] = output[nxt] + output[fail[nxt]]
+
+        self._compiled = (goto, fail, output)
+
+    def route(self, query: str) -> Optional[Tuple[str, str]]:
+        """
+        Route a query in a single pass.
+
+        Returns: (target, source) where source is 'agent', 'skill' or
+        'workflow', or None if no trigger matched.
+        """
+        if self._compiled is None:
+            self._compile()
+        goto, fail, output = self._compiled
+
+        text = normalize(query)
+        best = None
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for length, prefix_match, rank, target, source in output[state]:
+                if best is not None and rank >= best[0]:
+                    continue
+                start = i - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if not prefix_match and i + 1 < len(text) and text[i + 1].isalnum():
+                    continue
+                best = (rank, target, source)
+
+        if best is None:
+            return None
+        return best[1], best[2]
@@ -0,0 +1,286 @@
+# agents/orchestrator/VaultIndex.py
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional
+
+import yaml
+
+from orchestrator.SkillRegistry import FRONTMATTER_RE
+
+# Obsidian inline tags: #tag, #nested/tag, #open-research (not headings, not #123)
+TAG_RE = re.compile(r'(?<![\w#&/])#([A-Za-z0-9_\-/]*[A-Za-z_\-/][A-Za-z0-9_\-/]*)')
+# Wikilinks: [[Note]], [[Note#Heading]], [[Note|Alias]]
+LINK_RE = re.compile(r'\[\[([^\]|#]+)(?:#[^\]|]*)?(?:\|[^\]]*)?\]\]')
+
+NOTE_SUFFIXES = ('.md',)
+
+
+def extract_tags(content: str) -> List[Dict]:
+    """
+    Tags in a note, with the line each appears on (so callers can read
+    the topic next to e.g. #open-research). Frontmatter `tags:` are included.
+    """
+    tags = []
+    body = content
+    match = FRONTMATTER_RE.match(content)
+    if match:
+        body = content[match.end():]
+        try:
+            frontmatter = yaml.safe_load(match.group(1)) or {}
+        except yaml.YAMLError:
+            frontmatter = {}
+        fm_tags = frontmatter.get('tags', []) if isinstance(frontmatter, dict) else []
+        if isinstance(fm_tags, str):
+            fm_tags = fm_tags.replace(',', ' ').split()
+        for tag in fm_tags or []:
+            tags.append({'tag': str(tag).lstrip('#').lower(), 'line': ''})
+
+    in_code = False
+    for line in body.splitlines():
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        for tag in TAG_RE.findall(line):
+            tags.append({'tag': tag.lower(), 'line': line.strip()})
+    return tags
+
+
+def extract_links(content: str) -> List[str]:
+    """Wikilink targets in a note, deduplicated in order of appearance"""
+    seen = []
+    for target in LINK_RE.findall(content):
+        target = target.strip()
+        if target and target not in seen:
+            seen.append(target)
+    return seen
+
+
+class VaultIndex:
+    """
+    Persistent, incremental index of an Obsidian vault.
+
+    Stores path, mtime, size, created time and content hash per note,
+    plus its tags and wikilinks, in SQLite. refresh() only re-reads notes
+    whose mtime/size changed, and reuses a directory's cached listing when
+    the directory's own mtime hasn't changed (files were edited but none
+    were added, removed or renamed) - so a run on an unchanged vault is
+    one stat() per directory and note, with no file reads.
+
+    Usage (e.g. from ObsidianTool):
+        index = VaultIndex(vault_path)
+        index.refresh()
+        changed = index.changed_since(start_of_today)
+        research = index.tagged('open-research')
+    """
+
+    def __init__(self, vault_path: str, index_path: Optional[str] = None,
+                 skip_dirs: tuple = ('.obsidian', '.trash', '.git')):
+        """
+        Args:
+            vault_path: Root of the Obsidian vault
+            index_path: SQLite file for the index
+                (default: .cache/vault_index-<hash of vault path>.sqlite)
+            skip_dirs: Directory names never descended into
+        """
+        self.vault_path = Path(vault_path)
+        self.skip_dirs = set(skip_dirs)
+
+        if index_path is None:
+            digest = hashlib.sha1(str(self.vault_path.resolve()).encode()).hexdigest()[:12]
+            index_path = f".cache/vault_index-{digest}.sqlite"
+        if index_path != ":memory:":
+            Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(index_path, check_same_thread=False)
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS notes ("
+            " path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER,"
+            " created REAL, hash TEXT);"
+            "CREATE TABLE IF NOT EXISTS tags (path TEXT, tag TEXT, line TEXT);"
+            "CREATE INDEX IF NOT EXISTS tags_by_tag ON tags (tag);"
+            "CREATE INDEX IF NOT EXISTS tags_by_path ON tags (path);"
+            "CREATE TABLE IF NOT EXISTS links (path TEXT, target TEXT);"
+            "CREATE INDEX IF NOT EXISTS links_by_path ON links (path);"
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            " path TEXT PRIMARY KEY, mtime_ns INTEGER, subdirs TEXT, files TEXT);"
+            "CREATE INDEX IF NOT EXISTS notes_by_mtime ON notes (mtime_ns);"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+
+    def _list_dir(self, rel_dir: str, abs_dir: str, dir_mtime: int, cached_dirs: Dict):
+        """Subdirectories and note files of a directory, from cache if its mtime is unchanged"""
+        cached = cached_dirs.get(rel_dir)
+        if cached and cached[0] == dir_mtime:
+            return json.loads(cached[1]), json.loads(cached[2]), False
+
+        subdirs, files = [], []
+        with os.scandir(abs_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or entry.name in self.skip_dirs:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.name.endswith(NOTE_SUFFIXES) and entry.is_file():
+                    files.append(entry.name)
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+            (rel_dir, dir_mtime, json.dumps(subdirs), json.dumps(files))
+        )
+        return subdirs, files, True
+
+    def _index_note(self, rel_path: str, abs_path: str, st) -> bool:
+        """Read, hash and parse one note. Returns False if the content hash is unchanged."""
+        with open(abs_path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        created = getattr(st, 'st_birthtime', st.st_ctime)
+
+        row = self._db.execute("SELECT hash FROM notes WHERE path = ?", (rel_path,)).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?)",
+            (rel_path, st.st_mtime_ns, st.st_size, created, digest)
+        )
+        if row and row[0] == digest:
+            return False  # touched but not edited - tags/links still valid
+
+        content = raw.decode('utf-8', errors='replace')
+        self._db.execute("DELETE FROM tags WHERE path = ?", (rel_path,))
+        self._db.execute("DELETE FROM links WHERE path = ?", (rel_path,))
+        self._db.executemany(
+            "INSERT INTO tags VALUES (?, ?, ?)",
+            [(rel_path, t['tag'], t['line']) for t in extract_tags(content)]
+        )
+        self._db.executemany(
+            "INSERT INTO links VALUES (?, ?)",
+            [(rel_path, target) for target in extract_links(content)]
+        )
+        return True
+
+    def _remove_note(self, rel_path: str):
+        self._db.execute("DELETE FROM notes WHERE path = ?", (rel_path,))
+        self._db.execute("DELETE FROM tags WHERE path = ?", (rel_path,))
+        self._db.execute("DELETE FROM links WHERE path = ?", (rel_path,))
+
+    def refresh(self) -> Dict:
+        """
+        Bring the index up to date with the vault.
+
+        Returns: counters for what the scan had to do
+        (dirs listed vs reused, notes parsed, notes removed, seconds taken).
+        """
+        start = time.perf_counter()
+        stats = {'dirs_listed': 0, 'dirs_cached': 0, 'notes_stat': 0,
+                 'notes_parsed': 0, 'notes_removed': 0}
+
+        with self._lock:
+            cached_dirs = {row[0]: row[1:] for row in
+                           self._db.execute("SELECT path, mtime_ns, subdirs, files FROM dirs")}
+            known = {row[0]: (row[1], row[2]) for row in
+                     self._db.execute("SELECT path, mtime_ns, size FROM notes")}
+            seen_dirs, seen_notes = set(), set()
+
+            stack = ['']
+            while stack:
+                rel_dir = stack.pop()
+                abs_dir = os.path.join(self.vault_path, rel_dir)
+                try:
+                    dir_mtime = os.stat(abs_dir).st_mtime_ns
+                except OSError:
+                    continue
+                seen_dirs.add(rel_dir)
+
+                try:
+                    subdirs, files, listed = self._list_dir(rel_dir, abs_dir, dir_mtime, cached_dirs)
+                except OSError:
+                    # Removed (or made unreadable) since the stat
+                    seen_dirs.discard(rel_dir)
+                    continue
+                stats['dirs_listed' if listed else 'dirs_cached'] += 1
+                stack.extend(os.path.join(rel_dir, d) for d in subdirs)
+
+                for name in files:
+                    rel_path = os.path.join(rel_dir, name)
+                    abs_path = os.path.join(abs_dir, name)
+                    try:
+                        st = os.stat(abs_path)
+                    except OSError:
+                        continue
+                    stats['notes_stat'] += 1
+                    if known.get(rel_path) != (st.st_mtime_ns, st.st_size):
+                        try:
+                            parsed = self._index_note(rel_path, abs_path, st)
+                        except OSError:
+                            # Deleted, evicted (iCloud) or unreadable since the stat -
+                            # treat like a missing note; the next scan picks it up again
+                            continue
+                        if parsed:
+                            stats['notes_parsed'] += 1
+                    seen_notes.add(rel_path)
+
+            for rel_path in known.keys() - seen_notes:
+                self._remove_note(rel_path)
+                stats['notes_removed'] += 1
+            for rel_dir in cached_dirs.keys() - seen_dirs:
+                self._db.execute("DELETE FROM dirs WHERE path = ?", (rel_dir,))
+
+            self._db.commit()
+
+        stats['seconds'] = round(time.perf_counter() - start, 4)
+        return stats
+
+    def changed_since(self, timestamp: float) -> List[str]:
+        """Notes (vault-relative paths) modified at or after `timestamp` (epoch seconds)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path FROM notes WHERE mtime_ns >= ? ORDER BY path",
+                (int(timestamp * 1e9),)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def created_since(self, timestamp: float) -> List[str]:
+        """Notes created at or after `timestamp` (birth time where the OS records it)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path FROM notes WHERE created >= ? ORDER BY path", (timestamp,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def tagged(self, tag: str) -> List[Dict]:
+        """
+        Every occurrence of a tag: [{'path', 'line'}], ordered by path.
+        Nested tags match their parent (tagged('project') finds #project/x).
+        """
+        tag = tag.lstrip('#').lower()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path, line FROM tags WHERE tag = ? OR tag LIKE ? ESCAPE '\\'"
+                " ORDER BY path, rowid",
+                (tag, tag.replace('%', r'\%').replace('_', r'\_') + '/%')
+            ).fetchall()
+        return [{'path': path, 'line': line} for path, line in rows]
+
+    def tags_for(self, path: str) -> List[str]:
+        """Distinct tags in a note"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT tag FROM tags WHERE path = ? ORDER BY tag", (path,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def links_for(self, path: str) -> List[str]:
+        """Wikilink targets in a note"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT target FROM links WHERE path = ? ORDER BY rowid", (path,)
+            ).fetchall()
+        return [row[0] for row in rows]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Offline checks for Ollama host scheduling (run: python -m pytest test_ollama_pool.py)"""
+
+import asyncio
+
+from benchmarks.fake_ollama import FakeOllamaServer
+from orchestrator.OllamaPool import OllamaPool
+
+MODEL = 'llama3.2:3b'
+MESSAGES = [{'role': 'user', 'content': 'hello'}]
+
+
+def test_concurrent_requests_spread_over_hosts_once_a_model_is_resident():
+    hosts = [FakeOllamaServer(latency=0.1).start() for _ in range(2)]
+    try:
+        pool = OllamaPool([{'url': h.host} for h in hosts])
+        first = pool.candidates(MODEL)[0]
+        pool.chat(MODEL, MESSAGES)
+        assert pool.candidates(MODEL)[0] is first  # idle hosts: the resident one wins
+
+        async def batch():
+            await asyncio.gather(*(pool.achat(MODEL, MESSAGES) for _ in range(10)))
+
+        asyncio.run(batch())
+
+        served = sorted(h.requests for h in hosts)
+        assert sum(served) == 11
+        assert served[0] >= 4  # not 11/0 - outstanding requests come before residency
+        assert all(b.outstanding == 0 for b in pool.backends)
+    finally:
+        for h in hosts:
+            h.stop()
+
+
+def test_async_clients_are_reused_per_loop_and_closed_with_it():
+    host = FakeOllamaServer(latency=0).start()
+    try:
+        pool = OllamaPool([{'url': host.host}])
+        backend = pool.backends[0]
+
+        async def batch():
+            await asyncio.gather(*(pool.achat(MODEL, MESSAGES) for _ in range(3)))
+            assert len(backend._async_clients) == 1
+            return await backend.async_client()
+
+        clients = [asyncio.run(batch()) for _ in range(2)]
+        assert clients[0] is not clients[1]
+        assert all(client._client.is_closed for client in clients)
+        assert len(backend._async_clients) == 0
+    finally:
+        host.stop()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Offline checks for the page-fetch stage (run: python -m pytest test_page_fetcher.py)"""
+
+from benchmarks.fake_web import FakeWebServer
+from orchestrator.ContextBudget import best_passages
+from orchestrator.PageFetcher import PageFetcher
+
+
+def test_best_passages_respects_max_chars():
+    """passage_chars must cap what gets appended to each search snippet"""
+    paragraphs = ['alpha ' * 900, 'alpha beta ' * 20, 'gamma delta epsilon']
+    passages = best_passages('alpha', paragraphs, 1500)
+    assert len(passages) <= 1500
+    assert passages.endswith('...')
+
+    paragraphs = ['alpha one two', 'alpha three', 'zzz ' * 100]
+    passages = best_passages('alpha', paragraphs, 40)
+    assert len(passages) <= 40
+    assert passages == 'alpha one two\n\nalpha three'
+
+
+def test_deadline_starts_after_host_slot_and_partial_pages_are_not_cached():
+    site = FakeWebServer(latency=0.3).start()
+    try:
+        # Three pages queue behind per_host=1 for longer than the timeout,
+        # but each gets its own full deadline once it has the slot
+        fetcher = PageFetcher(':memory:', per_host=1, timeout=1.0)
+        pages = fetcher.fetch_many([f"{site.url}/topic/{n}" for n in range(3)])
+        assert all(len(page['paragraphs']) == 30 and 'partial' not in page for page in pages)
+
+        # A page still trickling in at the deadline is returned partial and not cached
+        fetcher = PageFetcher(':memory:', timeout=1.0)
+        page = fetcher.fetch(f"{site.url}/slow/page")
+        assert page.get('partial') is True
+        assert fetcher.stats()['entries'] == 0
+    finally:
+        site.stop()
+
+
+def test_stale_pages_are_revalidated_and_304_reuses_cached_text():
+    site = FakeWebServer(latency=0).start()
+    try:
+        fetcher = PageFetcher(':memory:')
+        url = f"{site.url}/quantum-computing/0"
+        first = fetcher.fetch(url)
+        assert not first['cached'] and len(first['paragraphs']) == 30
+
+        assert fetcher.fetch(url)['cached']  # fresh: no request at all
+        assert site.requests == 1
+
+        fetcher.ttl = 0  # stale: conditional request, answered with 304
+        again = fetcher.fetch(url)
+        assert site.requests == 2 and site.not_modified == 1
+        assert again['cached'] and again['paragraphs'] == first['paragraphs']
+        assert fetcher.stats()['revalidated'] == 1
+    finally:
+        site.stop()
+
+
+def test_max_bytes_stops_reading_large_pages():
+    site = FakeWebServer(latency=0).start()
+    try:
+        # max_chars high enough that only the byte cap can stop the read
+        fetcher = PageFetcher(':memory:', max_bytes=50_000, max_chars=10_000_000)
+        page = fetcher.fetch(f"{site.url}/big/page")
+        assert 'error' not in page and page['paragraphs']
+        # Reads stop at the first chunk boundary past the cap (chunks are at most 64 KiB)
+        assert fetcher.stats()['bytes_read'] < 50_000 + 65_536
+        assert len(page['paragraphs']) < 30 * 50
+    finally:
+        site.stop()
+
+
+def test_enrich_appends_at_most_passage_chars_per_result():
+    site = FakeWebServer(latency=0).start()
+    try:
+        fetcher = PageFetcher(':memory:', passage_chars=500)
+        results = [{'title': f"Result {n}", 'url': f"{site.url}/quantum-computing/{n}", 'snippet': 'short'}
+                   for n in range(3)]
+        enriched = fetcher.enrich('quantum energy', results)
+        for result in enriched:
+            assert 0 < len(result['content']) <= 500
+            assert result['snippet'] == f"short\n\n{result['content']}"
+    finally:
+        site.stop()
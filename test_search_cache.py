@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Offline checks for the search cache (run: python -m pytest test_search_cache.py)"""
+
+import threading
+import time
+
+from benchmarks.fixtures import CannedSearch
+from orchestrator.SearchCache import SearchCache
+
+
+def test_concurrent_identical_searches_make_one_backend_call():
+    backend = CannedSearch(latency=0.2)
+    cache = SearchCache(':memory:', rate=100, burst=100)
+    search = cache.wrap(backend.search_duckduckgo)
+
+    results = [None] * 8
+
+    def run(n):
+        results[n] = search('Quantum  Computing' if n % 2 else 'quantum computing', 5)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert backend.calls == 1
+    assert all(r == results[0] and len(r) == 5 for r in results)
+    assert cache.stats()['backend_calls'] == 1
+
+
+def test_offline_misses_never_call_the_backend():
+    backend = CannedSearch(latency=0)
+    cache = SearchCache(':memory:')
+    cache.search('cached topic', 3, backend.search_duckduckgo)
+
+    cache.offline = True
+    cache.ttl = 0  # offline mode serves stale entries
+    assert len(cache.search('cached topic', 3, backend.search_duckduckgo)) == 3
+
+    results = cache.search('new topic', 3, backend.search_duckduckgo)
+    assert 'error' in results[0]
+    assert backend.calls == 1
+    assert cache.stats()['misses'] == 2  # the first online lookup and the offline miss
+
+
+def test_least_recently_used_entries_are_evicted():
+    backend = CannedSearch(latency=0)
+    cache = SearchCache(':memory:', max_entries=2, rate=100, burst=100)
+    search = cache.wrap(backend.search_duckduckgo)
+
+    search('first', 3)
+    time.sleep(0.01)
+    search('second', 3)
+    time.sleep(0.01)
+    search('first', 3)   # hit - 'second' is now least recently used
+    time.sleep(0.01)
+    search('third', 3)   # evicts 'second'
+
+    assert cache.get('first', 3) is not None
+    assert cache.get('second', 3) is None
+    assert cache.get('third', 3) is not None
+    assert cache.stats()['evictions'] == 1